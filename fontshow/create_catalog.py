@@ -36,15 +36,41 @@ sensitive and used directly by the renderer.
 """
 
 import argparse
+import contextlib
+import functools
+import gzip
+import hashlib
 import json
 import os
 import platform
 import re
+import shutil
+import string
 import subprocess
 import sys
-from collections import OrderedDict
+import zlib
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
+from typing import TextIO
+
+try:
+    # Optional fast JSON decoder; parses bytes directly.
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    # Optional streaming JSON parser, used to read large inventories lazily.
+    import ijson
+
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
 # Platform-specific imports (deferred)
 if sys.platform == "win32":
@@ -72,6 +98,9 @@ else:
 DATE_STR = datetime.now().strftime("%Y%m%d")
 TEST_FONTS: set[str] = set()
 DEFAULT_INVENTORY = "font_inventory_enriched.json"
+DEFAULT_CACHE_DIR = Path(".fontshow_cache")
+CATALOG_CACHE_KEEP = 4  # rendered catalogs kept in the cache directory
+GZIP_MAGIC = b"\x1f\x8b"  # first bytes of a gzip-compressed inventory
 SCRIPT_BADGE_MAP = {
     "latin": "LAT",
     "greek": "GRK",
@@ -86,30 +115,32 @@ SCRIPT_BADGE_MAP = {
 }
 
 if IS_WINDOWS:
-    EXCLUDED_FONTS = {
-        # Fonts to exclude because they cause crashes or have known issues
-        # A classic symbolic font, often problematic in LuaTeX but not installed on this system, is:
-        #    "Hololens MDL2 Assets"
-        "Segoe MDL2 Assets",
-        "Segoe Fluent Icons",
-        "MT Extra",
-        "MS Reference Specialty",
-        "MS Outlook",
-        "Bookshelf Symbol 7",
-        "Webdings",
-        "Wingdings",
-        "Wingdings 2",
-        "Wingdings 3",
-        "Marlett",
-        "Symbol",
-        "Microsoft YaHei",
-        "Noto Sans Arabic",
-        "Noto Sans Hebrew",
-        "Yu Gothic",
-    }
+    EXCLUDED_FONTS = frozenset(
+        {
+            # Fonts to exclude because they cause crashes or have known issues
+            # A classic symbolic font, often problematic in LuaTeX but not installed on this system, is:
+            #    "Hololens MDL2 Assets"
+            "Segoe MDL2 Assets",
+            "Segoe Fluent Icons",
+            "MT Extra",
+            "MS Reference Specialty",
+            "MS Outlook",
+            "Bookshelf Symbol 7",
+            "Webdings",
+            "Wingdings",
+            "Wingdings 2",
+            "Wingdings 3",
+            "Marlett",
+            "Symbol",
+            "Microsoft YaHei",
+            "Noto Sans Arabic",
+            "Noto Sans Hebrew",
+            "Yu Gothic",
+        }
+    )
     DEFAULT_TEST_FONTS = {"Times New Roman", "Arial", "Calibri", "Noto Sans"}
 elif IS_LINUX:
-    EXCLUDED_FONTS = {"Noto Emoji", "KacstScreen"}
+    EXCLUDED_FONTS = frozenset({"Noto Emoji", "KacstScreen"})
     DEFAULT_TEST_FONTS = {
         "Times New Roman",
         "Arial",
@@ -119,9 +150,12 @@ elif IS_LINUX:
         "Devanagari",
     }
 else:
-    EXCLUDED_FONTS = set()
+    EXCLUDED_FONTS = frozenset()
     DEFAULT_TEST_FONTS = set()
 
+#: Lower-cased ``EXCLUDED_FONTS``, built once for case-insensitive lookups.
+_EXCLUDED_LC: frozenset[str] = frozenset(f.lower() for f in EXCLUDED_FONTS)
+
 # ============================================================
 # Sample texts (language-aware)
 # ============================================================
@@ -145,13 +179,23 @@ SAMPLE_TEXTS = {
     "ti": "ሰላም እንታይ ከመይ ኢኻ",
 }
 
-RTL_SCRIPTS = {"arab", "hebr"}
+RTL_SCRIPTS = frozenset({"arab", "hebr"})
 
 SCRIPT_TO_POLYGLOSSIA = {
     "arab": ("arabic", "Script=Arabic"),
     "hebr": ("hebrew", "Script=Hebrew"),
 }
 
+#: Everything an RTL sample needs, per script, resolved once at import:
+#: ``(polyglossia language, fontspec options, fallback sample text)``.
+_RTL_SAMPLE_PARAMS: dict[str, tuple[str, str, str]] = {
+    ps: (
+        *SCRIPT_TO_POLYGLOSSIA.get(ps, ("arabic", "Script=Arabic")),
+        SAMPLE_TEXTS.get("ar" if ps == "arab" else "he", ""),
+    )
+    for ps in RTL_SCRIPTS
+}
+
 # ============================================================
 # LaTeX rendering logic
 # ============================================================
@@ -315,6 +359,14 @@ NORMAL_BLOCK = """\\subsection{{{safe_name}}}
 
 \\vspace{{1em}}
 """
+
+#: ``NORMAL_BLOCK`` translated once, at import, into an equivalent
+#: ``%``-style template: ``%`` substitution runs entirely in C, with no
+#: per-font template parsing or Python-level loop.
+_NORMAL_BLOCK_PCT: str = "".join(
+    literal.replace("%", "%%") + (f"%({field})s" if field is not None else "")
+    for literal, field, _spec, _conv in string.Formatter().parse(NORMAL_BLOCK)
+)
 # --------------------------------------------
 LATEX_END_CODE_1 = r"""\newpage
 
@@ -379,6 +431,21 @@ def script_badges(font: dict) -> list[str]:
     return [SCRIPT_BADGE_MAP[s] for s in scripts if s in SCRIPT_BADGE_MAP]
 
 
+def _render_block(safe_name: str, font: str, badges: str, sample_code: str) -> str:
+    """Render ``NORMAL_BLOCK``; same result as ``NORMAL_BLOCK.format(...)``."""
+    return _NORMAL_BLOCK_PCT % {
+        "safe_name": safe_name,
+        "font": font,
+        "badges": badges,
+        "sample_code": sample_code,
+    }
+
+
+def is_excluded_font(name: str) -> bool:
+    """Return True if `name` is listed in `EXCLUDED_FONTS` (case-insensitive)."""
+    return name.lower() in _EXCLUDED_LC
+
+
 def get_unique_filename(base_name, extension):
     """Genera un nome file unico aggiungendo un contatore a tre cifre (000-999)."""
     for i in range(1000):
@@ -413,17 +480,26 @@ def fontspec_options(font: dict) -> str:
     return ""
 
 
+def fonts_by_family(fonts: Iterable[dict]) -> dict[str, dict]:
+    """Map each family name to its first font entry, in a single pass.
+
+    Keeps the first encountered font for each family (usually Regular or
+    `ttc_index` 0). Preserves order of first occurrence, and computes
+    `font_family` exactly once per entry.
+    """
+    families: dict[str, dict] = {}
+    for font in fonts:
+        families.setdefault(font_family(font), font)
+    return families
+
+
 def group_fonts_by_family(fonts: list[dict]) -> list[dict]:
     """Reduce a list of font entries to one entry per family.
 
     Keeps the first encountered font for each family (usually Regular or
     `ttc_index` 0). Preserves order of first occurrence.
     """
-    families = OrderedDict()
-    for font in fonts:
-        fam = font_family(font)
-        families.setdefault(fam, []).append(font)
-    return [entries[0] for entries in families.values()]
+    return list(fonts_by_family(fonts).values())
 
 
 # ============================================================
@@ -444,13 +520,72 @@ def load_font_inventory(path: Path) -> list[dict]:
     Notes:
         - This function does not touch font files.
         - It is safe to call on both Linux and Windows.
+        - Uses ``orjson`` when installed, the standard ``json`` module otherwise.
+        - Gzip-compressed inventories (``dump_fonts --gzip``) are accepted.
+    """
+    raw = Path(path).read_bytes()
+    if raw[:2] == GZIP_MAGIC:
+        raw = gzip.decompress(raw)
+    data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+    # --- Soft schema validation (warnings only off the 1.0 fast path) ---
+    metadata = data.get("metadata")
+    schema_version = (
+        metadata.get("schema_version") if isinstance(metadata, dict) else None
+    )
+    if schema_version != "1.0":
+        _warn_schema(schema_version)
+
+    fonts = data.get("fonts", [])
+
+    if not isinstance(fonts, list):
+        raise TypeError("Invalid inventory JSON: expected key 'fonts' to be a list.")
+    return fonts
+
+
+def iter_font_inventory(path: Path) -> Iterator[dict]:
     """
-    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    Yield the font descriptors of a Fontshow inventory one at a time.
 
-    # --- Soft schema validation ---
-    metadata = data.get("metadata", {}) or {}
-    schema_version = metadata.get("schema_version")
+    With ``ijson`` installed the file is parsed incrementally, so only the
+    descriptor currently being consumed is materialized. Without it, this
+    falls back to :func:`load_font_inventory`.
 
+    The soft schema check runs once the stream is exhausted, and a
+    non-list ``fonts`` value raises ``TypeError`` at that point.
+    """
+    if not IJSON_AVAILABLE:
+        yield from load_font_inventory(path)
+        return
+
+    state: dict = {"schema_version": None, "fonts_is_list": True}
+
+    def watch(events):
+        # Observe the parse events feeding ijson.items()
+        for prefix, event, value in events:
+            if prefix == "metadata.schema_version":
+                state["schema_version"] = value
+            elif prefix == "fonts" and event not in ("start_array", "end_array"):
+                state["fonts_is_list"] = False
+            yield prefix, event, value
+
+    with open(path, "rb") as raw:
+        compressed = raw.read(2) == GZIP_MAGIC
+        raw.seek(0)
+        with gzip.GzipFile(fileobj=raw) if compressed else raw as f:
+            yield from ijson.items(watch(ijson.parse(f, use_float=True)), "fonts.item")
+
+    if not state["fonts_is_list"]:
+        raise TypeError("Invalid inventory JSON: expected key 'fonts' to be a list.")
+    if state["schema_version"] != "1.0":
+        _warn_schema(state["schema_version"])
+
+
+def _warn_schema(schema_version) -> None:
+    """Print the soft schema warning for an unsupported `schema_version`.
+
+    Callers skip this for the supported ``"1.0"``.
+    """
     if schema_version is None:
         print("⚠️  Warning: inventory missing 'schema_version'; assuming legacy format")
     elif schema_version != "1.0":
@@ -458,12 +593,6 @@ def load_font_inventory(path: Path) -> list[dict]:
             f"⚠️  Warning: inventory schema_version '{schema_version}' not explicitly supported"
         )
 
-    fonts = data.get("fonts", [])
-
-    if not isinstance(fonts, list):
-        raise TypeError("Invalid inventory JSON: expected key 'fonts' to be a list.")
-    return fonts
-
 
 def as_font_desc_list(fonts: list) -> list[dict]:
     """
@@ -473,28 +602,70 @@ def as_font_desc_list(fonts: list) -> list[dict]:
     If `fonts` is a list of strings (legacy mode), each item becomes:
         {"identity": {"family": "<name>"}, "classification": {}, "inference": {}}
     """
-    out: list[dict] = []
+    return list(iter_font_descs(fonts))
+
+
+def iter_font_descs(fonts: Iterable) -> Iterator[dict]:
+    """Lazy variant of `as_font_desc_list`."""
     for f in fonts:
         if isinstance(f, dict):
-            out.append(f)
+            yield f
         else:
             print(
                 f"⚠️  Warning: unexpected font entry type {type(f)}, coercing to string"
             )
-            out.append(
-                {
-                    "identity": {"family": str(f)},
-                    "classification": {},
-                    "inference": {},
-                    "coverage": {},
-                }
-            )
-    return out
+            yield {
+                "identity": {"family": str(f)},
+                "classification": {},
+                "inference": {},
+                "coverage": {},
+            }
+
+
+def select_catalog_fonts(
+    fonts: Iterable, test_fonts: set[str], number: int | None = None
+) -> list[dict]:
+    """Filter, limit, deduplicate and sort fonts for the catalog.
+
+    This is a single streaming pass over `fonts`: only the retained entry of
+    each family is kept in memory (plus the last |N| entries for a negative
+    `number`).
+
+    Args:
+        fonts: Font descriptors or legacy family names.
+        test_fonts: If non-empty, keep only families containing one of these
+            substrings (case-insensitive).
+        number: Keep the first N entries (if positive) or the last |N|
+            (if negative), applied after the test-font filter.
+
+    Returns:
+        One descriptor per family, sorted by family name.
+    """
+    # (family, font) pairs: `font_family` runs once per entry, and the
+    # filter, dedup and sort below all reuse that key
+    pairs: Iterable[tuple[str, dict]] = (
+        (font_family(f), f) for f in iter_font_descs(fonts)
+    )
+    if test_fonts:
+        matches = make_test_font_matcher(test_fonts)
+        pairs = (p for p in pairs if matches(p[0]))
+
+    if number:
+        if number > 0:
+            pairs = islice(pairs, number)
+        else:
+            pairs = deque(pairs, maxlen=-number)
+
+    # One entry per family (first occurrence), sorted alphabetically
+    families: dict[str, dict] = {}
+    for fam, font in pairs:
+        families.setdefault(fam, font)
+    return [families[fam] for fam in sorted(families)]
 
 
 def font_family(font: dict) -> str:
     """Best-effort family name for LaTeX rendering and sorting."""
-    ident = font.get("identity", {}) if isinstance(font, dict) else {}
+    ident = (font.get("identity") or {}) if isinstance(font, dict) else {}
     return (
         ident.get("family")
         or ident.get("postscript_name")
@@ -504,23 +675,50 @@ def font_family(font: dict) -> str:
 
 
 def choose_sample_language(font: dict) -> str | None:
-    inf = font.get("inference", {}) or {}
-    langs = inf.get("languages", []) or []
-    if langs:
-        return str(langs[0])
-    cov_langs = font.get("coverage", {}).get("languages", []) or []
-    return str(cov_langs[0]) if cov_langs else None
+    langs = _languages_of(font.get("inference") or {}, font.get("coverage") or {})
+    return str(langs[0]) if langs else None
 
 
 def choose_sample_text(font: dict) -> str | None:
     lang = choose_sample_language(font)
-    if lang and lang in SAMPLE_TEXTS:
-        return SAMPLE_TEXTS[lang]
-    return None
+    return SAMPLE_TEXTS.get(lang) if lang else None
 
 
 def font_type_label(font: dict) -> str:
-    cls = font.get("classification", {}) or {}
+    return _type_label(font.get("classification") or {})
+
+
+def primary_script(font: dict) -> str | None:
+    scripts = _scripts_of(font.get("inference") or {}, font.get("coverage") or {})
+    return str(scripts[0]) if scripts else None
+
+
+def script_label(font: dict, max_scripts: int = 2) -> str:
+    scripts = _scripts_of(font.get("inference") or {}, font.get("coverage") or {})
+    return _script_label(scripts, max_scripts)
+
+
+def language_label(font: dict) -> str:
+    lang = choose_sample_language(font)
+    return lang.upper() if lang else "N/A"
+
+
+# Hot-path variants of the helpers above. They take the descriptor
+# sub-dicts (``inference``, ``classification``, ``coverage``) already
+# extracted, so each font is only walked once per render.
+
+
+def _scripts_of(inf: dict, cov: dict) -> list:
+    """Inferred scripts, falling back to the declared (coverage) ones."""
+    return inf.get("scripts") or cov.get("scripts") or []
+
+
+def _languages_of(inf: dict, cov: dict) -> list:
+    """Inferred languages, falling back to the declared (coverage) ones."""
+    return inf.get("languages") or cov.get("languages") or []
+
+
+def _type_label(cls: dict) -> str:
     if cls.get("is_emoji"):
         return "EMOJI"
     if cls.get("is_decorative"):
@@ -528,28 +726,42 @@ def font_type_label(font: dict) -> str:
     return "TEXT"
 
 
-def primary_script(font: dict) -> str | None:
-    inf = font.get("inference", {}) or {}
-    scripts = inf.get("scripts", []) or []
-    if scripts:
-        return str(scripts[0])
-    cov_scripts = font.get("coverage", {}).get("scripts", []) or []
-    return str(cov_scripts[0]) if cov_scripts else None
-
-
-def script_label(font: dict, max_scripts: int = 2) -> str:
-    inf = font.get("inference", {}) or {}
-    scripts = inf.get("scripts", []) or []
-    if not scripts:
-        scripts = font.get("coverage", {}).get("scripts", []) or []
+def _script_label(scripts: list | tuple, max_scripts: int = 2) -> str:
     if not scripts:
         return "UNKNOWN"
     return ", ".join(str(s).upper() for s in scripts[:max_scripts])
 
 
-def language_label(font: dict) -> str:
-    lang = choose_sample_language(font)
-    return lang.upper() if lang else "N/A"
+EMOJI_SAMPLE_TEXT = "😀 😃 😄 😁 😆 😅 😂 🤣 😊 😇"
+
+
+def _sample_text(cls: dict, fam: str, lang: str | None) -> str | None:
+    if cls.get("is_emoji"):
+        return EMOJI_SAMPLE_TEXT
+    if cls.get("is_decorative"):
+        return fam
+    return SAMPLE_TEXTS.get(lang) if lang else None
+
+
+def _render_labels(
+    fam: str, safe_name: str, nfss_id: str, scripts: list, langs: list, cls: dict
+) -> tuple[str, str]:
+    """Return ``(badges, sample_code)`` for one font from its resolved labels.
+
+    Same output as `render_badges` and `render_sample_code`, without
+    re-walking the descriptor for every label.
+    """
+    lang = str(langs[0]) if langs else None
+    ftype = _type_label(cls)
+
+    badges = _badges_for(tuple(map(str, scripts[:2])), lang, ftype)
+    sample_code = _sample_code(
+        safe_name,
+        nfss_id,
+        _sample_text(cls, fam, lang),
+        str(scripts[0]) if scripts else None,
+    )
+    return badges, sample_code
 
 
 def render_badges(font: dict) -> str:
@@ -560,10 +772,28 @@ def render_badges(font: dict) -> str:
     and script-direction issues. The returned string is valid LaTeX
     and may be empty.
     """
-    scripts = script_label(font)
-    languages = language_label(font)
-    ftype = font_type_label(font)
+    scripts = _scripts_of(font.get("inference") or {}, font.get("coverage") or {})
+    return _badges_for(
+        tuple(map(str, scripts[:2])),
+        choose_sample_language(font),
+        font_type_label(font),
+    )
+
 
+@functools.lru_cache(maxsize=1024)
+def _badges_for(scripts: tuple[str, ...], lang: str | None, ftype: str) -> str:
+    """Badge LaTeX for the inference key ``(scripts, lang, ftype)``.
+
+    `scripts` holds at most the two badge scripts. Fonts sharing a key
+    (most of a catalog) get the memoized string without re-deriving labels.
+    """
+    return _format_badges(
+        _script_label(scripts), lang.upper() if lang else "N/A", ftype
+    )
+
+
+def _format_badges(scripts: str, languages: str, ftype: str) -> str:
+    """Assemble the badge LaTeX for a label triple (see `_badges_for`)."""
     parts = []
     if scripts:
         parts.append(f"SCRIPTS: {scripts}")
@@ -581,16 +811,16 @@ def render_badges(font: dict) -> str:
 
 
 def render_sample_text(font: dict) -> str | None:
-    cls = font.get("classification", {}) or {}
-    fam = font_family(font)
-    if cls.get("is_emoji"):
-        return "😀 😃 😄 😁 😆 😅 😂 🤣 😊 😇"
-    if cls.get("is_decorative"):
-        return fam
-    return choose_sample_text(font)
+    return _sample_text(
+        font.get("classification") or {},
+        font_family(font),
+        choose_sample_language(font),
+    )
 
 
-def render_sample_code(font: dict, fam: str) -> str:
+def render_sample_code(
+    font: dict, fam: str, safe_name: str | None = None, nfss_id: str | None = None
+) -> str:
     """
     Build the LaTeX snippet for the sample.
 
@@ -599,20 +829,31 @@ def render_sample_code(font: dict, fam: str) -> str:
     - Never propagate weight/width/style inferred metadata.
     - For RTL scripts use TestNonLatin (polyglossia + harfbuzz).
     - For LTR scripts use a minimal, NFSS-safe fontspec call.
+
+    `safe_name` is the already escaped `fam`, if the caller has it.
+    `nfss_id` is the temporary NFSS family name; `generate_latex` assigns
+    one per family, otherwise a deterministic id is derived from `fam`.
     """
-    txt = render_sample_text(font)
-    ps = primary_script(font)
+    if safe_name is None:
+        safe_name = escape_latex(fam)
+    if nfss_id is None:
+        nfss_id = "FS" + str(zlib.crc32(fam.encode("utf-8")) % 10**8)
+    return _sample_code(
+        safe_name, nfss_id, render_sample_text(font), primary_script(font)
+    )
 
-    nfss_id = "FS" + str(abs(hash(fam)) % 10**8)
 
+def _sample_code(safe_name: str, nfss_id: str, txt: str | None, ps: str | None) -> str:
+    """Build the sample snippet from the sample text and primary script."""
     # RTL: unchanged (TestNonLatin already isolates fonts)
-    if ps in RTL_SCRIPTS:
-        lang, opts = SCRIPT_TO_POLYGLOSSIA.get(ps, ("arabic", "Script=Arabic"))
+    rtl = _RTL_SAMPLE_PARAMS.get(ps) if ps else None
+    if rtl is not None:
+        lang, opts, fallback_txt = rtl
         if not txt:
-            txt = SAMPLE_TEXTS.get("ar" if ps == "arab" else "he", "")
+            txt = fallback_txt
         return (
             r"\TestNonLatin{"
-            + escape_latex(fam)
+            + safe_name
             + r"}{"
             + lang
             + r"}{"
@@ -623,7 +864,7 @@ def render_sample_code(font: dict, fam: str) -> str:
         )
 
     if not txt:
-        return SAMPLE_1 + escape_latex(fam) + SAMPLE_2
+        return SAMPLE_1 + safe_name + SAMPLE_2
 
     return (
         r"\textbf{Esempio:}"
@@ -635,25 +876,29 @@ def render_sample_code(font: dict, fam: str) -> str:
         r"BoldFont={},"
         r"ItalicFont={},"
         r"BoldItalicFont={}"
-        r"]{" + escape_latex(fam) + r"}" + escape_latex(txt) + r"}"
+        r"]{" + safe_name + r"}" + escape_latex(txt) + r"}"
     )
 
 
 # --- System Functions ---
 
 
+# Built once: these run for every registry / fc-list entry.
+_PAREN_RE = re.compile(r"\s*\((?:TrueType|OpenType|True Type|Type 1)\)\s*$")
+_VARIANT_RE = re.compile(
+    r"\s+(?:Bold|Italic|Light|Regular|Medium|Semibold|Black|Thin|Heavy|Narrow|Condensed|Extended|Grassetto|Corsivo|Chiaro|Normale|Medio|Nero|Sottile|Pesante|Condensato|Esteso).*$",
+    re.IGNORECASE,
+)
+_FONT_EXTS = (".ttf", ".otf", ".ttc", ".fon")
+
+
 def clean_font_name(name: str) -> str:
     """Normalize a raw font name to a family-like base name.
 
     Removes parenthetical hints like `(TrueType)`, and strips common
     variant suffixes (Bold, Italic, etc.).
     """
-    clean_name = re.sub(r"\s*\((TrueType|OpenType|True Type|Type 1)\)\s*$", "", name)
-
-    variants = r"\s+(Bold|Italic|Light|Regular|Medium|Semibold|Black|Thin|Heavy|Narrow|Condensed|Extended|Grassetto|Corsivo|Chiaro|Normale|Medio|Nero|Sottile|Pesante|Condensato|Esteso).*$"
-    base_name = re.sub(variants, "", clean_name, flags=re.IGNORECASE).strip()
-
-    return base_name
+    return _VARIANT_RE.sub("", _PAREN_RE.sub("", name)).strip()
 
 
 def get_installed_fonts_windows():
@@ -675,9 +920,9 @@ def get_installed_fonts_windows():
                 for i in range(winreg.QueryInfoKey(key)[1]):
                     name, value, _ = winreg.EnumValue(key, i)
 
-                    if re.search(r"\.(ttf|otf|ttc|fon)$", value, re.IGNORECASE):
+                    if value.lower().endswith(_FONT_EXTS):
                         base_name = clean_font_name(name)
-                        if base_name and base_name not in EXCLUDED_FONTS:
+                        if base_name and not is_excluded_font(base_name):
                             font_list.add(base_name)
 
         except FileNotFoundError:
@@ -704,7 +949,7 @@ def get_font_details_windows():
                 for i in range(winreg.QueryInfoKey(key)[1]):
                     name, value, _ = winreg.EnumValue(key, i)
 
-                    if re.search(r"\.(ttf|otf|ttc|fon)$", value, re.IGNORECASE):
+                    if value.lower().endswith(_FONT_EXTS):
                         base_name = clean_font_name(name)
                         details.append(
                             {
@@ -726,17 +971,11 @@ def extract_font_family(line):
     Example input: '/usr/share/fonts/foo.ttf:Family Name:style'
     Returns the family part (comma-separated families are left intact).
     """
-    parts = line.split(":")
-
-    if len(parts) < 2:
+    # Formats: path:family, path:family:style or path:family:other:style
+    _path, sep, rest = line.partition(":")
+    if not sep:
         return ""
-    elif len(parts) == 2:
-        # Format: path:family
-        return parts[1].strip()
-    else:
-        # Format: path:family:style or path:family:other:style
-        # Join all elements except the first and last
-        return ":".join(parts[1:2]).strip()
+    return rest.partition(":")[0].strip()
 
 
 def get_installed_fonts_linux() -> list[str]:
@@ -747,10 +986,8 @@ def get_installed_fonts_linux() -> list[str]:
     print("Sistema: Linux. Uso 'fc-list' per l'estrazione dei font...")
     try:
         # Executes fc-list and captures the output
-        result = subprocess.run(
-            ["fc-list", ":family"], capture_output=True, text=True, check=True
-        )
-        lines = result.stdout.strip().split("\n")
+        result = subprocess.run(["fc-list", ":family"], capture_output=True, check=True)
+        lines = result.stdout.decode("utf-8", errors="replace").splitlines()
 
         font_list = set()
         for line in lines:
@@ -758,7 +995,7 @@ def get_installed_fonts_linux() -> list[str]:
                 family_part = extract_font_family(line)
                 for name in family_part.split(","):
                     base_name = name.strip()
-                    if base_name and base_name not in EXCLUDED_FONTS:
+                    if base_name and not is_excluded_font(base_name):
                         font_list.add(base_name)
 
         return sorted(list(font_list))
@@ -780,10 +1017,8 @@ def get_font_details_linux() -> list[dict]:
     details = []
     try:
         # Executes fc-list and captures the output
-        result = subprocess.run(
-            ["fc-list", ":family"], capture_output=True, text=True, check=True
-        )
-        lines = result.stdout.strip().split("\n")
+        result = subprocess.run(["fc-list", ":family"], capture_output=True, check=True)
+        lines = result.stdout.decode("utf-8", errors="replace").splitlines()
 
         for line in lines:
             if ":" in line:
@@ -838,14 +1073,11 @@ def generate_test_output(limit: int | None = None, filter_test: bool = False) ->
         return
 
     if filter_test:
+        matches = make_test_font_matcher(TEST_FONTS)
         details = [
             item
             for item in details
-            if any(
-                sub.lower() in name.lower()
-                for name in item["base_names"]
-                for sub in TEST_FONTS
-            )
+            if any(matches(name) for name in item["base_names"])
         ]
 
     if limit:
@@ -872,12 +1104,9 @@ def generate_test_output(limit: int | None = None, filter_test: bool = False) ->
     print(f"Test file generated: {test_filename}")
 
 
-def escape_latex(text: str) -> str:
-    """Escape LaTeX special characters in `text`.
-
-    Returns a string safe to embed in LaTeX source.
-    """
-    replacements = {
+#: ``str.translate`` table for :func:`escape_latex`.
+_LATEX_ESCAPES = str.maketrans(
+    {
         "&": r"\&",
         "%": r"\%",
         "$": r"\$",
@@ -888,59 +1117,111 @@ def escape_latex(text: str) -> str:
         "~": r"\textasciitilde{}",
         "^": r"\textasciicircum{}",
     }
-    return "".join(replacements.get(c, c) for c in text)
+)
+
+
+@functools.lru_cache(maxsize=8192)
+def escape_latex(text: str) -> str:
+    """Escape LaTeX special characters in `text`.
+
+    Returns a string safe to embed in LaTeX source. Results are memoized:
+    family names and sample texts repeat heavily across a catalog.
+    """
+    return text.translate(_LATEX_ESCAPES)
 
 
-def generate_latex(font_list: list[dict]) -> str:
+def generate_latex(font_list: list[dict], out: TextIO | None = None) -> str | None:
     """Generate the full LaTeX document for the provided font descriptors.
 
     The input may be a list of descriptors (as produced by
     `parse_font_inventory.py`) or a legacy list of strings (family names).
+
+    With `out`, the document is written to that text stream chunk by chunk
+    and ``None`` is returned, so the whole document is never held in
+    memory; otherwise it is returned as a string.
     """
+    chunks = _latex_chunks(font_list)
+    if out is None:
+        return "".join(chunks)
+    out.writelines(chunks)
+    return None
 
-    font_list = as_font_desc_list(font_list)
 
-    # --- DEDUPLICATION BY FAMILY ---
-    seen_families = set()
-    unique_fonts = []
-    for font in font_list:
-        fam = font_family(font)
-        if fam not in seen_families:
-            seen_families.add(fam)
-            unique_fonts.append(font)
+def _latex_chunks(font_list: list[dict]) -> Iterator[str]:
+    """Yield the LaTeX document for `generate_latex` in order."""
 
-    font_list = unique_fonts
+    # --- DEDUPLICATION BY FAMILY ---
+    families = fonts_by_family(as_font_desc_list(font_list))
 
-    print(f"Generating LaTeX file for {len(font_list)} fonts...")
+    print(f"Generating LaTeX file for {len(families)} fonts...")
 
-    latex_code = LATEX_INITIAL_CODE
+    yield LATEX_INITIAL_CODE
 
-    total = len(font_list)
-    for idx, font in enumerate(font_list, start=1):
-        fam = font_family(font)
+    total = len(families)
+    for idx, (fam, font) in enumerate(families.items(), start=1):
+        inf = font.get("inference") or {}
+        cov = font.get("coverage") or {}
         safe_name = escape_latex(fam)
-        badges = render_badges(font)
-        sample_code = render_sample_code(font, fam)
+        badges, sample_code = _render_labels(
+            fam,
+            safe_name,
+            # Per-family counter: unique within the document and, unlike
+            # hash(), stable across runs
+            f"FS{idx:08d}",
+            _scripts_of(inf, cov),
+            _languages_of(inf, cov),
+            font.get("classification") or {},
+        )
 
         if idx % 500 == 0 or idx == total:
             print(f"  ... processed {idx}/{total}")
 
-        block = NORMAL_BLOCK.format(
-            safe_name=safe_name,
-            font=fam,
-            badges=badges,
-            sample_code=sample_code,
-        )
-        latex_code += "\n" + block
+        yield "\n" + _render_block(safe_name, fam, badges, sample_code)
 
-    latex_code += "\n\n"
-    for font in sorted(list(EXCLUDED_FONTS)):
-        block = r"\LogExcluded{" + font + "}\n"
-        latex_code += block
+    yield "\n\n"
+    for font in sorted(EXCLUDED_FONTS):
+        yield r"\LogExcluded{" + font + "}\n"
 
     # Closing document and printing indices
-    latex_code += LATEX_END_CODE_1 + str(total) + LATEX_END_CODE_2
-    return latex_code
+    yield LATEX_END_CODE_1
+    yield str(total)
+    yield LATEX_END_CODE_2
+
+
+def catalog_cache_key(
+    inventory: Path, test_fonts: Iterable[str], number: int | None
+) -> str:
+    """Return the cache key of the catalog rendered from `inventory`.
+
+    The LaTeX output is a pure function of the inventory bytes, the test
+    font set, the ``-n`` limit, the platform name (in the preamble) and this
+    module's templates and rendering code, so all of them are hashed.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(Path(__file__).read_bytes())
+    h.update(repr((platform.system(), sorted(test_fonts), number)).encode("utf-8"))
+    with open(inventory, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def prune_catalog_cache(cache_dir: Path, keep: int = CATALOG_CACHE_KEEP) -> None:
+    """Delete all but the `keep` most recently used cached catalogs.
+
+    Cache hits refresh the file's modification time, so it orders entries
+    by last use. Files that cannot be removed are left in place.
+    """
+    entries = []
+    for path in cache_dir.glob("catalog_*.tex"):
+        try:
+            entries.append((path.stat().st_mtime_ns, path))
+        except OSError:
+            continue
+    entries.sort(reverse=True)
+    for _, path in entries[keep:]:
+        with contextlib.suppress(OSError):
+            path.unlink()
 
 
 def font_matches_test_set(font_name: str, test_fonts: set[str]) -> bool:
@@ -949,8 +1230,23 @@ def font_matches_test_set(font_name: str, test_fonts: set[str]) -> bool:
 
     Matching is currently case-insensitive and substring-based.
     """
-    lname = font_name.lower()
-    return any(t.lower() in lname for t in test_fonts)
+    return make_test_font_matcher(test_fonts)(font_name)
+
+
+def make_test_font_matcher(test_fonts: Iterable[str]) -> Callable[[str], bool]:
+    """
+    Build a predicate equivalent to `font_matches_test_set` for a fixed set.
+
+    The test names are lower-cased once, so each candidate name costs a
+    single `.lower()` plus one substring scan per test name.
+    """
+    lowered = tuple({t.lower() for t in test_fonts})
+
+    def matches(font_name: str) -> bool:
+        lname = font_name.lower()
+        return any(t in lname for t in lowered)
+
+    return matches
 
 
 # ============================================================
@@ -1017,6 +1313,17 @@ def main() -> None:
         type=int,
         help="Limit the number of processed fonts to the first N (if positive) or the last |N| (if negative)",
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=DEFAULT_CACHE_DIR,
+        help="Directory used to cache rendered catalogs",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always re-render the catalog, ignoring and not updating the cache",
+    )
     args = parser.parse_args()
 
     TEST_FONTS = set()
@@ -1047,11 +1354,8 @@ def main() -> None:
         print("\nInstalled fonts matching TEST_FONTS:")
 
         installed_fonts = get_installed_fonts()
-        matched = [
-            fname
-            for fname in installed_fonts
-            if font_matches_test_set(fname, TEST_FONTS)
-        ]
+        matches = make_test_font_matcher(TEST_FONTS)
+        matched = [fname for fname in installed_fonts if matches(fname)]
 
         if not matched:
             print("  (none)")
@@ -1081,44 +1385,66 @@ def main() -> None:
         if default.exists():
             inv_path = default
 
+    cache_file: Path | None = None
+    fonts: list[dict] | None = None
     if inv_path and inv_path.exists():
-        fonts = load_font_inventory(inv_path)
-        print(f"✓ Inventory loaded: {inv_path} ({len(fonts)} fonts)")
+        if not args.no_cache:
+            key = catalog_cache_key(inv_path, TEST_FONTS, args.number)
+            cache_file = args.cache_dir / f"catalog_{key}.tex"
+        if cache_file is not None and cache_file.exists():
+            print(f"✓ Inventory unchanged, reusing cached catalog: {cache_file}")
+        else:
+            # Streamed: parsing overlaps with selection, only kept fonts stay
+            # in memory
+            fonts = select_catalog_fonts(
+                iter_font_inventory(inv_path), TEST_FONTS, args.number
+            )
+            print(f"✓ Inventory loaded: {inv_path} ({len(fonts)} font families)")
     else:
         print("[1/3] Inventory not found, fallback to legacy detection...")
-        fonts = get_installed_fonts()
-        if not fonts:
+        installed = get_installed_fonts()
+        if not installed:
             print("✗ No fonts to catalog or system error.")
             sys.exit(1)
-    if TEST_FONTS:
-        fonts = [
-            f
-            for f in as_font_desc_list(fonts)
-            if any(sub.lower() in font_family(f).lower() for sub in TEST_FONTS)
-        ]
-
-    if args.number:
-        if args.number > 0:
-            fonts = fonts[: args.number]
-        else:
-            fonts = fonts[args.number :]
-
-    # Sort alphabetically the list of fonts
-    fonts = sorted(as_font_desc_list(fonts), key=font_family)
-    fonts = group_fonts_by_family(fonts)
-
-    latex_content = generate_latex(fonts)
+        fonts = select_catalog_fonts(installed, TEST_FONTS, args.number)
 
     print(f"[2/3] Writing file {OUTPUT_FILENAME}...")
+    # Written to a temporary file and moved into place on success, so a
+    # failed run never leaves a truncated document behind
+    tmp = Path(f"{OUTPUT_FILENAME}.tmp")
     try:
-        with open(OUTPUT_FILENAME, "w", encoding="utf-8") as f:
-            f.write(latex_content)
-        print("✓ Done! LaTeX file generated successfully.")
-        print("[3/3] Ready for compilation.")
-        print(f"  Execute: lualatex {OUTPUT_FILENAME} (twice)")
-    except Exception as e:
+        try:
+            if fonts is None:
+                shutil.copyfile(cache_file, tmp)
+                with contextlib.suppress(OSError):
+                    os.utime(cache_file)
+            else:
+                # Blocks are streamed into a large write buffer as they are
+                # rendered
+                with open(tmp, "w", encoding="utf-8", buffering=1 << 20) as f:
+                    generate_latex(fonts, f)
+            os.replace(tmp, OUTPUT_FILENAME)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+    except OSError as e:
         print(f"✗ Error writing file: {e}")
         sys.exit(1)
+    except Exception as e:
+        print(f"✗ Error generating LaTeX: {e}")
+        sys.exit(1)
+    print("✓ Done! LaTeX file generated successfully.")
+    print("[3/3] Ready for compilation.")
+    print(f"  Execute: lualatex {OUTPUT_FILENAME} (twice)")
+
+    if fonts is not None and cache_file is not None:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(OUTPUT_FILENAME, cache_file)
+        except OSError as e:
+            print(f"⚠️  Warning: could not cache the catalog: {e}")
+        else:
+            prune_catalog_cache(cache_file.parent)
 
 
 if __name__ == "__main__":
@@ -32,17 +32,28 @@ The JSON schema is documented in:
 """
 
 import argparse
+import array
+import bisect
+import contextlib
+import copy
+import functools
 import getpass
+import gzip
 import hashlib
 import json
 import os
 import platform
 import socket
+import sqlite3
+import struct
 import subprocess
 import sys
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, BinaryIO
 
 from fontshow import __version__ as FONTSHOW_VERSION
 
@@ -62,6 +73,14 @@ except ImportError:
     # which is sufficient for our static checks.
     FONTTOOLS_AVAILABLE = False
 
+try:
+    # Optional fast JSON encoder/decoder; works on bytes directly.
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 if TYPE_CHECKING:
     from fontTools.ttLib import TTCollection, TTFont
 
@@ -106,12 +125,31 @@ NAME_ID_LICENSE_URL = 14
 NAME_ID_TYPOGRAPHIC_SUBFAMILY = 17
 NAME_ID_SAMPLE_TEXT = 19
 
+#: nameIDs used by :func:`build_font_descriptor`; other name records are
+#: neither decoded nor cached.
+DESCRIPTOR_NAME_IDS = frozenset(
+    {
+        NAME_ID_FAMILY,
+        NAME_ID_SUBFAMILY,
+        NAME_ID_FULLNAME,
+        NAME_ID_POSTSCRIPT,
+        NAME_ID_LICENSE,
+        NAME_ID_LICENSE_URL,
+    }
+)
+
 # -----------------------
 # Platform helpers
 # -----------------------
 IS_LINUX = sys.platform.startswith("linux")
 IS_WINDOWS = sys.platform.startswith("win")
 
+# Platform-specific imports (deferred)
+if sys.platform == "win32":
+    import winreg
+else:
+    winreg = None
+
 
 def utc_now_iso() -> str:
     return datetime.now(UTC).replace(microsecond=0).isoformat()
@@ -174,14 +212,19 @@ def get_installed_font_files_linux() -> list[Path]:
     if proc.returncode != 0:
         raise RuntimeError(f"fc-list failed:\n{proc.stdout}")
 
-    files: list[Path] = []
-    for line in proc.stdout.splitlines():
+    # fc-list prints one line per face (TTC members, named instances), so
+    # deduplicate the raw strings before touching the filesystem. A strict
+    # resolve both canonicalizes the path and drops stale entries.
+    files: set[Path] = set()
+    for line in set(proc.stdout.splitlines()):
         p = line.strip()
-        if p:
-            files.append(Path(p))
-
-    # Resolve + unique
-    return sorted({p.resolve() for p in files if p.exists()})
+        if not p:
+            continue
+        try:
+            files.add(Path(p).resolve(strict=True))
+        except (OSError, RuntimeError):
+            continue
+    return sorted(files)
 
 
 def _windows_font_dirs() -> list[Path]:
@@ -204,18 +247,241 @@ def _windows_font_dirs() -> list[Path]:
     return [d for d in dirs if d.exists()]
 
 
+_WINDOWS_FONT_EXTS = (".ttf", ".otf", ".ttc", ".otc", ".woff", ".woff2")
+
+
+_WINDOWS_FONTS_KEY = r"SOFTWARE\Microsoft\Windows NT\CurrentVersion\Fonts"
+
+
 def get_installed_font_files_windows() -> list[Path]:
-    exts = {".ttf", ".otf", ".ttc", ".otc", ".woff", ".woff2"}
-    found: set[Path] = set()
-    for d in _windows_font_dirs():
+    """Windows font discovery: registered fonts, or a directory scan.
+
+    Installed fonts are read from the Windows font registry (machine-wide
+    and per-user), which needs no directory walk. If the registry cannot
+    be read, the known font directories are scanned instead.
+    """
+    files = get_registered_font_files_windows()
+    if files:
+        return files
+    return scan_font_dirs_windows()
+
+
+def get_registered_font_files_windows() -> list[Path] | None:
+    r"""Return the font files listed in the Windows font registry.
+
+    Values under ``HKLM`` and ``HKCU`` ``...\Windows NT\CurrentVersion\Fonts``
+    hold either a file name relative to ``%WINDIR%\Fonts`` or an absolute
+    path (per-user installs). Bitmap and other non-outline formats, and
+    entries whose file no longer exists, are skipped.
+
+    Returns:
+        Sorted, deduplicated paths, or ``None`` if the registry is not
+        available (non-Windows platforms, missing machine-wide key).
+    """
+    if winreg is None:
+        return None
+    windir = os.environ.get("WINDIR") or os.environ.get("SystemRoot") or "C:/Windows"
+    fonts_dir = os.path.join(windir, "Fonts")
+
+    found: dict[str, Path] = {}
+    for hive in (winreg.HKEY_LOCAL_MACHINE, winreg.HKEY_CURRENT_USER):
         try:
-            for p in d.rglob("*"):
-                if p.is_file() and p.suffix.lower() in exts:
-                    found.add(p.resolve())
-        except Exception:
+            with winreg.OpenKey(hive, _WINDOWS_FONTS_KEY) as key:
+                values = [
+                    winreg.EnumValue(key, i)[1]
+                    for i in range(winreg.QueryInfoKey(key)[1])
+                ]
+        except OSError:
+            if hive == winreg.HKEY_LOCAL_MACHINE:
+                return None
+            continue
+        for value in values:
+            if not isinstance(value, str) or not value.lower().endswith(
+                _WINDOWS_FONT_EXTS
+            ):
+                continue
+            path = os.path.join(fonts_dir, value)  # no-op for absolute paths
+            key_path = os.path.normcase(os.path.abspath(path))
+            if key_path not in found and os.path.isfile(path):
+                found[key_path] = Path(path)
+    return sorted(found.values())
+
+
+def scan_font_dirs_windows() -> list[Path]:
+    """Windows font discovery by scanning the known font directories.
+
+    Directories are walked with ``os.scandir``, whose entries carry the
+    file type, so no per-file ``stat`` is needed. Paths are deduplicated
+    case-insensitively (the fallback directory usually repeats ``%WINDIR%``).
+    """
+    found: dict[str, Path] = {}
+    pending = [str(d) for d in _windows_font_dirs()]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file() and entry.name.lower().endswith(
+                            _WINDOWS_FONT_EXTS
+                        ):
+                            key = os.path.normcase(os.path.abspath(entry.path))
+                            found.setdefault(key, Path(entry.path))
+                    except OSError:
+                        continue
+        except OSError:
             # ignore permission issues etc.
             continue
-    return sorted(found)
+    return sorted(found.values())
+
+
+def stat_font_files(font_files: list[Path]) -> dict[Path, os.stat_result]:
+    """Stat every font file once; unreadable files are omitted.
+
+    The result feeds :func:`inventory_is_up_to_date`,
+    :func:`identical_file_map` and :func:`disk_order_key`, which would
+    otherwise each stat every file again.
+    """
+    stats: dict[Path, os.stat_result] = {}
+    for p in font_files:
+        try:
+            stats[p] = p.stat()
+        except OSError:
+            continue
+    return stats
+
+
+def disk_order_key(path: Path, st: os.stat_result | None = None) -> tuple[int, int]:
+    """Sort key approximating on-disk placement: ``(st_dev, st_ino)``.
+
+    Reading files in inode order improves readahead on large collections,
+    notably on spinning disks. Unreadable paths sort first. ``st`` may be
+    passed to reuse an earlier ``stat`` of ``path``.
+    """
+    if st is None:
+        try:
+            st = path.stat()
+        except OSError:
+            return (0, 0)
+    return (st.st_dev, st.st_ino)
+
+
+def identical_file_map(
+    font_files: list[Path], stats: dict[Path, os.stat_result] | None = None
+) -> dict[Path, Path]:
+    """Map every font file to the first file with byte-identical content.
+
+    The same font is often installed more than once (user and system font
+    directories, application bundles). Extraction then only has to run for
+    one copy per group. Files are first grouped by size; only files sharing
+    a size are hashed, so the common case costs one ``stat`` per file.
+    Unreadable files map to themselves.
+
+    Args:
+        font_files: Font files in discovery order.
+        stats: Optional precomputed :func:`stat_font_files` result.
+
+    Returns:
+        Mapping ``{font_path: representative_path}``; representatives map to
+        themselves.
+    """
+    if stats is None:
+        stats = stat_font_files(font_files)
+    by_size: dict[int, list[Path]] = {}
+    for p in font_files:
+        st = stats.get(p)
+        if st is not None:
+            by_size.setdefault(st.st_size, []).append(p)
+
+    canonical = {p: p for p in font_files}
+    for group in by_size.values():
+        if len(group) < 2:
+            continue
+        first_by_digest: dict[bytes, Path] = {}
+        for p in group:
+            try:
+                with p.open("rb") as f:
+                    digest = hashlib.file_digest(f, "blake2b").digest()
+            except OSError:
+                continue
+            canonical[p] = first_by_digest.setdefault(digest, p)
+    return canonical
+
+
+def iter_in_discovery_order(
+    font_files: list[Path],
+    canonical: dict[Path, Path],
+    schedule: list[Path],
+    results: Iterable[Any],
+) -> Iterator[Any]:
+    """Yield one result per file of ``font_files``, consuming ``results`` lazily.
+
+    ``results`` is aligned with ``schedule`` (the extraction order, see
+    :func:`disk_order_key`), which only lists the representatives of
+    :func:`identical_file_map`. Results that arrive before their turn in
+    discovery order are kept until needed; each one is released after its
+    last copy in ``font_files`` has been yielded.
+
+    Args:
+        font_files: Font files in discovery order.
+        canonical: :func:`identical_file_map` result covering ``font_files``.
+        schedule: Representatives, in the order ``results`` are produced.
+        results: One result per entry of ``schedule``.
+
+    Yields:
+        The result of ``canonical[p]`` for each ``p`` in ``font_files``.
+    """
+    remaining: dict[Path, int] = {}
+    for p in font_files:
+        remaining[canonical[p]] = remaining.get(canonical[p], 0) + 1
+    arrived = zip(schedule, results, strict=True)
+    pending: dict[Path, Any] = {}
+    for p in font_files:
+        key = canonical[p]
+        while key not in pending:
+            done, result = next(arrived)
+            pending[done] = result
+        result = pending[key]
+        remaining[key] -= 1
+        if not remaining[key]:
+            del pending[key]
+        yield result
+
+
+def prefetch_font_files(font_files: list[Path]) -> threading.Thread | None:
+    """Ask the kernel to read ``font_files`` ahead, in a background thread.
+
+    Issues ``posix_fadvise(POSIX_FADV_WILLNEED)`` for each file, in order,
+    so that disk reads overlap with extraction instead of happening on
+    demand. The hints are advisory and errors are ignored.
+
+    Args:
+        font_files: Files in the order they will be extracted.
+
+    Returns:
+        The started daemon thread, or ``None`` when the platform has no
+        ``posix_fadvise`` (e.g. Windows, macOS).
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return None
+
+    def _advise() -> None:
+        for p in font_files:
+            try:
+                fd = os.open(p, os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+
+    thread = threading.Thread(target=_advise, name="fontshow-prefetch", daemon=True)
+    thread.start()
+    return thread
 
 
 # -----------------------
@@ -223,17 +489,36 @@ def get_installed_font_files_windows() -> list[Path]:
 # -----------------------
 
 
-def detect_font_container(path: Path) -> str:
+def read_font_header(path: Path, size: int = 12) -> bytes:
+    """Return the first ``size`` bytes of ``path``, or ``b""`` on error.
+
+    The default covers both the container tag and the TTC face count.
+    """
+    # Raw descriptor I/O: no buffered file object is needed for a few bytes.
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    except OSError:
+        return b""
+    try:
+        return os.read(fd, size)
+    except OSError:
+        return b""
+    finally:
+        os.close(fd)
+
+
+def detect_font_container(path: Path, header: bytes | None = None) -> str:
     """Detect font container by header and extension.
 
+    ``header`` may pass bytes already read by :func:`read_font_header`, to
+    avoid reopening the file.
+
     Returns: "TTF", "OTF", "TTC", "WOFF", "WOFF2", or "UNKNOWN"
     """
     ext = path.suffix.lower()
-    try:
-        with path.open("rb") as f:
-            head = f.read(4)
-    except Exception:
-        head = b""
+    if header is None:
+        header = read_font_header(path, 4)
+    head = header[:4]
 
     if head == b"ttcf":
         return "TTC"
@@ -250,19 +535,154 @@ def detect_font_container(path: Path) -> str:
     return "UNKNOWN"
 
 
+def dump_json(data: Any, *, indent: bool = False) -> bytes:
+    """Serialize ``data`` as UTF-8 JSON, compact or indented by two spaces.
+
+    Uses ``orjson`` when installed, the standard ``json`` module otherwise.
+    Both keep non-ASCII text as-is and produce the same layout.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+        except TypeError:
+            # Values orjson rejects (e.g. integers wider than 64 bits)
+            pass
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def load_json(raw: bytes) -> Any:
+    """Parse UTF-8 JSON bytes, using ``orjson`` when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+#: First bytes of a gzip stream (see ``--gzip``).
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+@contextlib.contextmanager
+def open_output(path: Path, *, compress: bool = False) -> Iterator[BinaryIO]:
+    """Open ``path`` for atomic binary writing, optionally gzip-compressed.
+
+    Data is written to ``<path>.tmp`` and moved over ``path`` only once the
+    block completes, so an interrupted run never leaves a truncated
+    inventory behind. Compressed output uses a fixed header timestamp, so
+    identical inventories produce identical files.
+
+    A ``path`` of ``-`` writes to standard output instead, as data is
+    produced (and therefore not atomically).
+    """
+    if str(path) == "-":
+        stdout = sys.stdout.buffer
+        if compress:
+            with gzip.GzipFile(
+                filename="", mode="wb", compresslevel=6, fileobj=stdout, mtime=0
+            ) as f:
+                yield f
+        else:
+            yield stdout
+        stdout.flush()
+        return
+
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp, "wb") as raw:
+            if compress:
+                with gzip.GzipFile(
+                    filename="", mode="wb", compresslevel=6, fileobj=raw, mtime=0
+                ) as f:
+                    yield f
+            else:
+                yield raw
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def write_inventory_json(
+    f: BinaryIO,
+    metadata: dict[str, Any],
+    descriptors: Iterable[dict[str, Any]],
+    *,
+    indent: bool = False,
+) -> None:
+    """Write a ``{"metadata", "fonts"}`` inventory one descriptor at a time.
+
+    The output is byte-identical to ``dump_json`` of the whole inventory,
+    but the ``fonts`` list and the full encoded document are never held in
+    memory. Nested indentation is obtained by shifting each encoded
+    descriptor, which is safe because JSON strings never contain raw
+    newlines.
+    """
+    if indent:
+        f.write(b'{\n  "metadata": ')
+        f.write(dump_json(metadata, indent=True).replace(b"\n", b"\n  "))
+        f.write(b',\n  "fonts": [')
+        sep, close, close_empty = b"\n    ", b"\n  ]\n}", b"]\n}"
+    else:
+        f.write(b'{"metadata":')
+        f.write(dump_json(metadata))
+        f.write(b',"fonts":[')
+        sep, close, close_empty = b"", b"]}", b"]}"
+
+    empty = True
+    for desc in descriptors:
+        f.write(sep if empty else b"," + sep)
+        encoded = dump_json(desc, indent=indent)
+        f.write(encoded.replace(b"\n", sep) if indent else encoded)
+        empty = False
+    f.write(close_empty if empty else close)
+
+
+def ttc_face_count(path: Path, header: bytes | None = None) -> int | None:
+    """Return the number of faces declared in a TTC header, or ``None``.
+
+    Reads only the 12-byte ``ttcf`` header (or uses ``header``, as returned
+    by :func:`read_font_header`), so callers can look faces up in the cache
+    without opening the collection with fontTools.
+    """
+    if header is None:
+        header = read_font_header(path)
+    if len(header) < 12 or header[:4] != b"ttcf":
+        return None
+    return struct.unpack(">I", header[8:12])[0]
+
+
 # -----------------------
 # Cache
 # -----------------------
 
 
-def font_cache_key(path: Path, ttc_index: int | None = None) -> str:
+#: Version of the cached per-face block layout. Bump it whenever the
+#: extraction output changes, so that stale cache entries are not reused.
+CACHE_FORMAT_VERSION = 2
+
+
+def _file_cache_id(path: Path, st: os.stat_result | None = None) -> str:
+    """Return the per-file part of :func:`font_cache_key` (path, mtime, size).
+
+    ``st`` may pass a ``stat`` result the caller already has.
+    """
+    if st is None:
+        st = path.stat()
+    return f"{path.resolve()}|{st.st_mtime_ns}|{st.st_size}"
+
+
+def font_cache_key(
+    path: Path, ttc_index: int | None = None, *, file_id: str | None = None
+) -> str:
     """Return a stable cache key for a font *face*.
 
     The cache key uniquely identifies a *specific font face* by combining:
     - the absolute file path,
     - file modification time (nanoseconds),
     - file size,
-    - optional TTC face index.
+    - optional TTC face index,
+    - :data:`CACHE_FORMAT_VERSION`.
 
     This guarantees that cache entries are invalidated whenever the font file
     changes on disk, while still allowing efficient reuse across runs.
@@ -270,14 +690,88 @@ def font_cache_key(path: Path, ttc_index: int | None = None) -> str:
     Args:
         path: Path to the font file.
         ttc_index: Face index for TrueType Collections (``None`` for single-face fonts).
+        file_id: Precomputed :func:`_file_cache_id` for ``path``; lets callers
+            keying many faces of one collection stat and resolve it only once.
 
     Returns:
-        A SHA-256 hexadecimal digest suitable for use as a filename.
+        A 128-bit BLAKE2b hexadecimal digest.
     """
-    st = path.stat()
+    if file_id is None:
+        file_id = _file_cache_id(path)
     idx = "" if ttc_index is None else f"|ttc:{ttc_index}"
-    key = f"{path.resolve()}|{st.st_mtime_ns}|{st.st_size}{idx}"
-    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+    key = f"{file_id}{idx}|v{CACHE_FORMAT_VERSION}"
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
+
+#: Name of the SQLite database holding the per-face cache in ``cache_dir``.
+CACHE_DB_NAME = "fonttools_cache.sqlite3"
+
+_cache_local = threading.local()
+
+
+def _cache_connection(cache_dir: Path) -> sqlite3.Connection:
+    """Return this thread's connection to the per-face cache database.
+
+    SQLite connections cannot be shared between threads (or forked
+    processes), so one connection is kept per thread, per process and per
+    cache directory. WAL mode lets concurrent workers read while another
+    one writes, and ``synchronous=NORMAL`` avoids an fsync per commit.
+    """
+    conns = getattr(_cache_local, "conns", None)
+    if conns is None:
+        conns = _cache_local.conns = {}
+    key = (os.getpid(), str(cache_dir))
+    conn = conns.get(key)
+    if conn is None:
+        conn = sqlite3.connect(cache_dir / CACHE_DB_NAME, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, blob BLOB)"
+        )
+        conn.commit()
+        conns[key] = conn
+    return conn
+
+
+def cache_get(cache_dir: Path, key: str) -> Any:
+    """Return the cached value for ``key``, or ``None`` on a miss.
+
+    Unreadable entries and database errors are treated as misses.
+    """
+    try:
+        row = (
+            _cache_connection(cache_dir)
+            .execute("SELECT blob FROM cache WHERE key = ?", (key,))
+            .fetchone()
+        )
+        return None if row is None else load_json(row[0])
+    except (sqlite3.Error, ValueError):
+        return None
+
+
+def cache_put(cache_dir: Path, key: str, value: Any) -> None:
+    """Store ``value`` (JSON-serializable) under ``key``, best-effort."""
+    cache_put_many(cache_dir, [(key, value)])
+
+
+def cache_put_many(cache_dir: Path, items: Iterable[tuple[str, Any]]) -> None:
+    """Store several ``(key, value)`` pairs in a single transaction.
+
+    Used for the faces of a collection, so that a TTC costs one commit
+    instead of one per face.
+    """
+    rows = [(key, dump_json(value)) for key, value in items]
+    if not rows:
+        return
+    try:
+        conn = _cache_connection(cache_dir)
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO cache (key, blob) VALUES (?, ?)", rows
+            )
+    except sqlite3.Error:
+        pass
 
 
 # -----------------------
@@ -297,6 +791,16 @@ def extract_sample_text(font_path: str) -> list[str] | None:
     except Exception:
         return None
 
+    return extract_sample_text_from_tt(tt)
+
+
+def extract_sample_text_from_tt(tt: TTFont) -> list[str] | None:
+    """
+    Extract embedded sample text (nameID 19) from an already-open face.
+
+    Returns:
+        list[str] | None
+    """
     if "name" not in tt:
         return None
 
@@ -329,24 +833,50 @@ def extract_sample_text(font_path: str) -> list[str] | None:
     return unique_samples
 
 
-def _parse_fc_charset_ranges(raw: str) -> list[str]:
+#: ``key:`` prefixes of the single-valued ``fc-query`` lines.
+_FC_QUERY_FIELDS = frozenset({"lang", "capability", "decorative", "color", "variable"})
+
+
+def _parse_fc_query_output(
+    raw: str, include_charset: bool = False
+) -> tuple[dict[str, str], list[str]]:
     """
-    Extract compact Unicode ranges from a FontConfig charset block.
+    Parse ``fc-query`` output in a single pass over its lines.
 
     Example input:
+        lang: en|it
         charset: 0000-007F 0100-017F
 
     Returns:
-        A list of Unicode ranges as strings, e.g. ["0000-007F", "0100-017F"].
+        A ``(fields, ranges)`` tuple: the stripped payload of the first line
+        for each key in :data:`_FC_QUERY_FIELDS`, and the Unicode ranges of
+        all ``charset:`` lines (only collected with ``include_charset``),
+        e.g. ``["0000-007F", "0100-017F"]``.
     """
+    fields: dict[str, str] = {}
     ranges: list[str] = []
     for line in raw.splitlines():
-        line = line.strip()
-        if line.startswith("charset:"):
-            payload = line[len("charset:") :].strip()
-            if payload:
-                ranges.extend(payload.split())
-    return ranges
+        key, sep, payload = line.partition(":")
+        if not sep:
+            continue
+        if key in _FC_QUERY_FIELDS:
+            fields.setdefault(key, payload.strip())
+        elif include_charset and key.lstrip() == "charset":
+            ranges.extend(payload.split())
+    return fields, ranges
+
+
+#: ``fc-query --format`` templates. They emit exactly the ``key: value``
+#: lines parsed by :func:`fc_query_extract`; the charset (expensive for
+#: FontConfig to serialize) is only requested when needed.
+_FC_QUERY_FORMAT_MIN = (
+    "lang: %{lang}\n"
+    "capability: %{capability}\n"
+    "decorative: %{decorative}\n"
+    "color: %{color}\n"
+    "variable: %{variable}\n"
+)
+_FC_QUERY_FORMAT_FULL = _FC_QUERY_FORMAT_MIN + "charset: %{charset}\n"
 
 
 def fc_query_extract(path: Path, include_charset: bool = False) -> dict[str, Any]:
@@ -379,52 +909,168 @@ def fc_query_extract(path: Path, include_charset: bool = False) -> dict[str, Any
     Returns:
         A dictionary with zero or more of the keys described above.
     """
-    proc = run_command(["fc-query", str(path)])
+    fmt = _FC_QUERY_FORMAT_FULL if include_charset else _FC_QUERY_FORMAT_MIN
+    proc = run_command(["fc-query", f"--format={fmt}", str(path)])
     raw = proc.stdout if proc.stdout else ""
 
-    def _find_line(prefix: str) -> str | None:
-        """Return the payload of the first line starting with ``prefix``."""
-        for line in raw.splitlines():
-            if line.startswith(prefix):
-                return line[len(prefix) :].strip()
-        return None
+    fields, ranges = _parse_fc_query_output(raw, include_charset)
 
-    lang = _find_line("lang:")
-    languages: list[str] = []
     charset: dict[str, Any] | None = None
+    if ranges:
+        charset = {
+            "source": "fontconfig",
+            "ranges": ranges,
+        }
+
+    return _fontconfig_block(
+        lang=fields.get("lang"),
+        capability=fields.get("capability"),
+        decorative=fields.get("decorative"),
+        color=fields.get("color"),
+        variable=fields.get("variable"),
+        charset=charset,
+    )
+
+
+#: Files per batched ``fc-query`` call, well below typical ``ARG_MAX``.
+FC_QUERY_BATCH_SIZE = 500
+
+
+def fc_query_extract_batch(
+    paths: list[Path], include_charset: bool = False
+) -> dict[Path, dict[str, Any]]:
+    """Run :func:`fc_query_extract` for many files with few ``fc-query`` calls.
+
+    ``fc-query`` accepts several files and prints one block per face. Each
+    block is prefixed with its ``file:`` line, and the lines of all faces
+    of a file are parsed together, exactly as for a single-file call.
 
+    Args:
+        paths: Font files to query.
+        include_charset: Forwarded semantics of :func:`fc_query_extract`.
+
+    Returns:
+        Mapping ``{path: fontconfig_block}`` with an entry for every path.
+    """
+    fmt = "file: %{file}\n" + (
+        _FC_QUERY_FORMAT_FULL if include_charset else _FC_QUERY_FORMAT_MIN
+    )
+    by_name = {str(p): p for p in paths}
+    lines: dict[Path, list[str]] = {p: [] for p in paths}
+    for start in range(0, len(paths), FC_QUERY_BATCH_SIZE):
+        chunk = [str(p) for p in paths[start : start + FC_QUERY_BATCH_SIZE]]
+        proc = run_command(["fc-query", f"--format={fmt}", *chunk])
+        current: list[str] | None = None
+        for line in (proc.stdout or "").splitlines():
+            if line.startswith("file: "):
+                path = by_name.get(line[len("file: ") :])
+                current = None if path is None else lines[path]
+            elif current is not None:
+                current.append(line)
+
+    out: dict[Path, dict[str, Any]] = {}
+    for p, file_lines in lines.items():
+        fields, ranges = _parse_fc_query_output("\n".join(file_lines), include_charset)
+        out[p] = _fontconfig_block(
+            lang=fields.get("lang"),
+            capability=fields.get("capability"),
+            decorative=fields.get("decorative"),
+            color=fields.get("color"),
+            variable=fields.get("variable"),
+            charset=({"source": "fontconfig", "ranges": ranges} if ranges else None),
+        )
+    return out
+
+
+def _fontconfig_block(
+    *,
+    lang: str | None,
+    capability: str | None,
+    decorative: str | None,
+    color: str | None,
+    variable: str | None,
+    charset: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Build the ``fontconfig`` block from raw FontConfig property strings.
+
+    Shared by :func:`fc_query_extract` and :func:`fc_list_extract`, which
+    obtain the same properties from different commands.
+
+    Returns:
+        A dictionary with the keys documented in :func:`fc_query_extract`.
+    """
+    languages: list[str] = []
     if lang:
         languages = [x.strip() for x in lang.split("|") if x.strip()]
 
-    decorative = (_find_line("decorative:") or "").strip().lower() == "true"
-    color = (_find_line("color:") or "").strip().lower() == "true"
-    variable = (_find_line("variable:") or "").strip().lower() == "true"
-    capability = _find_line("capability:")
-
     scripts: list[str] = []
     if capability:
         for token in capability.replace('"', "").split():
             if token.startswith("otlayout:"):
                 scripts.append(token.split(":", 1)[1])
 
-    if include_charset:
-        try:
-            ranges = _parse_fc_charset_ranges(raw)
-            if ranges:
-                charset = {
-                    "source": "fontconfig",
-                    "ranges": ranges,
-                }
-        except Exception:
-            charset = None
-
     return {
         "languages": languages,
         "scripts": sorted(set(scripts)),
         "charset": charset,
-        "decorative": decorative,
-        "color": color,
-        "variable": variable,
+        "decorative": (decorative or "").strip().lower() == "true",
+        "color": (color or "").strip().lower() == "true",
+        "variable": (variable or "").strip().lower() == "true",
+    }
+
+
+#: ``fc-list --format`` template for :func:`fc_list_extract`: one
+#: tab-separated line per face with the fields used by ``fc_query_extract``.
+_FC_LIST_FORMAT = (
+    "%{file}\t%{index}\t%{lang}\t%{capability}\t%{decorative}\t%{color}\t%{variable}\n"
+)
+
+
+def fc_list_extract() -> dict[Path, dict[str, Any]] | None:
+    """Extract FontConfig metadata for all installed fonts with one ``fc-list``.
+
+    This is the batched counterpart of :func:`fc_query_extract`: instead of
+    spawning ``fc-query`` once per file, a single ``fc-list`` call returns
+    the same properties for every face. As with ``fc-query``, the data is
+    file-level; for collections and variable fonts the lowest face index
+    (the default face) is used.
+
+    The charset is not available this way; callers that need it must keep
+    using :func:`fc_query_extract`.
+
+    Returns:
+        Mapping ``{resolved_font_path: fontconfig_block}``, or ``None`` if
+        ``fc-list`` failed.
+    """
+    try:
+        proc = run_command(["fc-list", f"--format={_FC_LIST_FORMAT}"])
+    except OSError:
+        return None
+    if proc.returncode != 0:
+        return None
+
+    best: dict[Path, tuple[int, list[str]]] = {}
+    for line in proc.stdout.splitlines():
+        fields = line.split("\t")
+        if len(fields) != 7 or not fields[0]:
+            continue
+        try:
+            index = int(fields[1] or 0)
+        except ValueError:
+            index = 0
+        path = Path(fields[0]).resolve()
+        if path not in best or index < best[path][0]:
+            best[path] = (index, fields)
+
+    return {
+        path: _fontconfig_block(
+            lang=fields[2],
+            capability=fields[3],
+            decorative=fields[4],
+            color=fields[5],
+            variable=fields[6],
+        )
+        for path, (_, fields) in best.items()
     }
 
 
@@ -439,16 +1085,22 @@ def _best_name(names: dict[str, list[str]], name_id: int) -> str | None:
         The first non-empty, stripped string for the given nameID, or ``None``
         if no usable value is found.
     """
-    vals = names.get(str(name_id), [])
-    for v in vals:
-        if v and v.strip():
-            return v.strip()
+    for v in names.get(str(name_id), ()):
+        if v:
+            v = v.strip()
+            if v:
+                return v
     return None
 
 
-def extract_name_table(tt: TTFont) -> dict[str, list[str]]:
+def extract_name_table(
+    tt: TTFont, name_ids: frozenset[int] = DESCRIPTOR_NAME_IDS
+) -> dict[str, list[str]]:
     """Extract the OpenType/TrueType name table as a JSON-friendly mapping.
 
+    Only records whose ``nameID`` is in ``name_ids`` are decoded, which
+    skips most of the table in fonts with many localized names.
+
     Data structure:
         The returned dictionary maps ``nameID`` (string) to a list of unique
         values, preserving the first-seen order.
@@ -463,6 +1115,7 @@ def extract_name_table(tt: TTFont) -> dict[str, list[str]]:
 
     Args:
         tt: An already-open ``TTFont`` instance (single face).
+        name_ids: nameIDs to extract.
 
     Returns:
         A mapping ``{name_id_str: [values...]}``. Returns an empty dict if the
@@ -473,6 +1126,8 @@ def extract_name_table(tt: TTFont) -> dict[str, list[str]]:
         return out
     name_table = tt["name"]
     for rec in name_table.names:  # type: ignore[attr-defined]
+        if rec.nameID not in name_ids:
+            continue
         try:
             s = rec.toUnicode()
         except Exception:
@@ -541,38 +1196,222 @@ def detect_color_tables(tt: TTFont) -> list[str]:
     return [t for t in candidates if t in tt]
 
 
-def compute_unicode_blocks(codepoints: set[int]) -> dict[str, int]:
+def compute_unicode_blocks(codepoints: Iterable[int]) -> dict[str, int]:
     """Count how many code points fall into each configured Unicode block.
 
     Args:
-        codepoints: Set of Unicode code points present in the font cmap.
+        codepoints: Distinct Unicode code points present in the font cmap.
 
     Returns:
         Mapping ``{block_name: count}`` containing only blocks with count > 0.
     """
     blocks: dict[str, int] = {}
 
+    # Sort once, then count each block with two binary searches instead of
+    # scanning every code point for every block.
+    cps = sorted(codepoints)
     for name, start, end in UNICODE_BLOCKS:
-        count = sum(1 for cp in codepoints if start <= cp <= end)
+        count = bisect.bisect_right(cps, end) - bisect.bisect_left(cps, start)
         if count > 0:
             blocks[name] = count
 
     return blocks
 
 
+#: ``(platformID, platEncID)`` preference order of ``cmap.getBestCmap``,
+#: followed by the Windows Symbol subtable (3, 0) that symbol fonts
+#: (Symbol, Wingdings, ...) carry instead of a Unicode one.
+_UNICODE_CMAP_PREFERENCE = (
+    (3, 10),
+    (0, 6),
+    (0, 4),
+    (3, 1),
+    (0, 3),
+    (0, 2),
+    (0, 1),
+    (0, 0),
+    (3, 0),
+)
+
+
+def best_unicode_cmap(tt: TTFont) -> dict[int, str]:
+    """Return the face's preferred Unicode cmap (``{codepoint: glyph_name}``).
+
+    ``TTFont.getBestCmap`` picks a single Unicode subtable (full repertoire
+    first, then BMP), so only that subtable is decompiled. Symbol fonts fall
+    back to their (3, 0) subtable, whose code points are mostly in the
+    Private Use Area. Faces with neither yield an empty mapping.
+    """
+    if "cmap" not in tt:
+        return {}
+    return tt.getBestCmap(cmapPreferences=_UNICODE_CMAP_PREFERENCE) or {}
+
+
+#: Minimum subtable length per format, as enforced by fontTools.
+_CMAP_MIN_SUBTABLE_LENGTH = {0: 6, 2: 6, 4: 6, 6: 6, 12: 16, 13: 16, 14: 10}
+
+
+def _cmap4_codepoints(sub: bytes) -> list[int] | None:
+    """Return the mapped code points of a format 4 subtable, or ``None``.
+
+    Follows the fontTools decoder: the final segment is ignored and code
+    points resolving to glyph 0 are not mapped.
+    """
+    if len(sub) < 14 or len(sub) % 2:
+        return None
+    seg_count = struct.unpack_from(">H", sub, 6)[0] // 2
+    codes = array.array("H", sub[14:])
+    if sys.byteorder != "big":
+        codes.byteswap()
+    end_codes = codes[:seg_count]
+    codes = codes[seg_count + 1 :]  # skip reservedPad
+    start_codes = codes[:seg_count]
+    codes = codes[seg_count:]
+    deltas = codes[:seg_count]
+    codes = codes[seg_count:]
+    range_offsets = codes[:seg_count]
+    glyph_ids = codes[seg_count:]
+    if len(range_offsets) < len(start_codes) or len(end_codes) < len(start_codes):
+        return None
+
+    found: set[int] = set()
+    for i in range(len(start_codes) - 1):
+        start, end = start_codes[i], end_codes[i]
+        delta, range_offset = deltas[i], range_offsets[i]
+        if range_offset == 0:
+            missing = -delta & 0xFFFF
+            if start <= missing <= end:
+                found.update(range(start, missing))
+                found.update(range(missing + 1, end + 1))
+            else:
+                found.update(range(start, end + 1))
+            continue
+        partial = range_offset // 2 - start + i - len(range_offsets)
+        for cp in range(start, end + 1):
+            index = cp + partial
+            if not 0 <= index < len(glyph_ids):
+                return None
+            gid = glyph_ids[index]
+            if gid and (gid + delta) & 0xFFFF:
+                found.add(cp)
+    return sorted(found)
+
+
+def _cmap12_codepoints(sub: bytes) -> list[int] | None:
+    """Return the mapped code points of a well-formed format 12 subtable.
+
+    Groups must be ascending, non-overlapping and within U+10FFFF;
+    otherwise ``None`` is returned.
+    """
+    if len(sub) < 16:
+        return None
+    _, _, length, _, n_groups = struct.unpack_from(">HHLLL", sub)
+    if length != len(sub) or length != 16 + n_groups * 12:
+        return None
+    codepoints: list[int] = []
+    last_end = -1
+    for start, end, gid in struct.iter_unpack(">LLL", sub[16:]):
+        if start > end or end > 0x10FFFF or start <= last_end:
+            return None
+        last_end = end
+        # A group starting at glyph 0 leaves its first code point unmapped
+        codepoints.extend(range(start + (gid == 0), end + 1))
+    return codepoints
+
+
+def raw_cmap_codepoints(data: bytes) -> list[int] | None:
+    """Return the sorted code points of the best Unicode subtable of a raw cmap.
+
+    This is ``sorted(best_unicode_cmap(tt))`` without building glyph names.
+    Only well-formed format 4 and 12 subtables are decoded here; for any
+    other format, or for anything fontTools might reject or repair,
+    ``None`` is returned and the caller should use fontTools instead.
+
+    Args:
+        data: Raw ``cmap`` table bytes.
+    """
+    if len(data) < 4:
+        return None
+    num_subtables = struct.unpack_from(">H", data, 2)[0]
+    if 4 + num_subtables * 8 > len(data):
+        return None
+
+    decoders = {4: _cmap4_codepoints, 12: _cmap12_codepoints}
+    subtables: dict[tuple[int, int], tuple[int, bytes]] = {}
+    seen_offsets: set[int] = set()
+    for i in range(num_subtables):
+        platform_id, enc_id, offset = struct.unpack_from(">HHL", data, 4 + i * 8)
+        if offset + 8 > len(data):
+            return None
+        fmt, length = struct.unpack_from(">HH", data, offset)
+        if fmt in (8, 10, 12, 13):
+            length = struct.unpack_from(">L", data, offset + 4)[0]
+        elif fmt == 14:
+            length = struct.unpack_from(">L", data, offset + 2)[0]
+        if not length:
+            continue  # skipped by fontTools
+        if length < _CMAP_MIN_SUBTABLE_LENGTH.get(fmt, 0):
+            return None
+        if offset + length > len(data):
+            return None
+        sub = data[offset : offset + length]
+        # fontTools validates every format 12/13 header up front...
+        if fmt in (12, 13):
+            if length != 16 + struct.unpack_from(">L", sub, 12)[0] * 12:
+                return None
+        # ...and fully decodes subtables shared by several records.
+        if offset in seen_offsets:
+            if fmt not in decoders or decoders[fmt](sub) is None:
+                return None
+        seen_offsets.add(offset)
+        subtables.setdefault((platform_id, enc_id), (fmt, sub))
+
+    for pref in _UNICODE_CMAP_PREFERENCE:
+        if pref in subtables:
+            fmt, sub = subtables[pref]
+            return decoders[fmt](sub) if fmt in decoders else None
+    return []
+
+
+def unicode_codepoints(tt: TTFont) -> list[int]:
+    """Return the sorted code points of the face's best Unicode cmap.
+
+    Same result as ``sorted(best_unicode_cmap(tt))``. While the ``cmap``
+    table has not been decompiled, it is read directly with
+    :func:`raw_cmap_codepoints`: fontTools would otherwise resolve a glyph
+    name for every code point, which dominates extraction time for large
+    CJK fonts.
+    """
+    if "cmap" not in tt:
+        return []
+    reader = getattr(tt, "reader", None)
+    if reader is not None and "cmap" not in tt.tables:
+        try:
+            codepoints = raw_cmap_codepoints(reader["cmap"])
+        except Exception:
+            codepoints = None
+        if codepoints is not None:
+            return codepoints
+    return sorted(best_unicode_cmap(tt))
+
+
 def extract_unicode_coverage(tt: TTFont, limit: int = 200_000) -> dict[str, Any]:
     """Compute a lightweight Unicode coverage summary from cmap.
 
     To keep inventories reasonably small, this function does *not* store the full
     cmap/codepoint list. Instead it stores:
 
-    - ``count``: number of distinct code points observed (capped by ``limit``)
+    - ``count``: number of distinct code points (capped at ``limit``)
     - ``min``: minimum code point or ``None``
     - ``max``: maximum code point or ``None``
 
+    Only the best Unicode subtable is considered (see
+    :func:`best_unicode_cmap`, which falls back to the Windows Symbol
+    subtable); other legacy encodings are ignored.
+
     Args:
         tt: An already-open ``TTFont`` instance (single face).
-        limit: Maximum number of distinct code points to collect before stopping.
+        limit: Upper bound reported for ``count``.
 
     Returns:
         A dictionary with keys ``count``, ``min``, ``max``.
@@ -580,21 +1419,22 @@ def extract_unicode_coverage(tt: TTFont, limit: int = 200_000) -> dict[str, Any]
     """
     if "cmap" not in tt:
         return {}
-    cmap = tt["cmap"]
-    cps: set[int] = set()
-    for sub in cmap.tables:  # type: ignore[attr-defined]
-        try:
-            cm = sub.cmap  # type: ignore[attr-defined]
-        except Exception:
-            continue
-        for cp in cm.keys():
-            if isinstance(cp, int):
-                cps.add(cp)
-        if len(cps) > limit:
-            break
-    if not cps:
+    return summarize_codepoints(unicode_codepoints(tt), limit)
+
+
+def summarize_codepoints(codepoints: list[int], limit: int = 200_000) -> dict[str, Any]:
+    """Return ``count``/``min``/``max`` for an ascending code point list.
+
+    The list is already sorted for :func:`compute_unicode_blocks`, so the
+    extremes are its first and last items.
+    """
+    if not codepoints:
         return {"count": 0, "min": None, "max": None}
-    return {"count": len(cps), "min": min(cps), "max": max(cps)}
+    return {
+        "count": min(len(codepoints), limit),
+        "min": codepoints[0],
+        "max": codepoints[-1],
+    }
 
 
 def extract_opentype_features(tt: TTFont) -> list[str]:
@@ -615,12 +1455,27 @@ def extract_opentype_features(tt: TTFont) -> list[str]:
     return sorted(feats)
 
 
+def table_tags(tt: TTFont) -> list[str]:
+    """Return the sorted table tags of a face, like ``sorted(tt.keys())``.
+
+    ``TTFont.keys()`` orders the tags by the OpenType table order before
+    they are sorted again, and compares fontTools ``Tag`` objects; plain
+    strings in a set are an order of magnitude cheaper per face. The
+    ``GlyphOrder`` pseudo-table is included, as in ``TTFont.keys()``.
+    """
+    tags = {"GlyphOrder", *map(str, tt.tables)}
+    if tt.reader is not None:
+        tags.update(map(str, tt.reader.keys()))
+    return sorted(tags)
+
+
 def _fonttools_extract_from_tt(
     *,
     path: Path,
     container: str,
     tt: TTFont,
     ttc_index: int | None,
+    shared: dict[tuple, Any] | None = None,
 ) -> dict[str, Any]:
     """Extract a per-face metadata block from an open ``TTFont``.
 
@@ -635,6 +1490,7 @@ def _fonttools_extract_from_tt(
         - ``tables``: list[str], present table tags
         - ``font_type``: str, coarse font type classification
         - ``names``: dict[str, list[str]] name table mapping (or error dict)
+        - ``sample_text``: list[str]|None embedded sample texts (nameID 19)
         - ``os2``: dict[str, Any] OS/2 subset (or error dict)
         - ``unicode``: dict[str, Any] coverage summary (or error dict)
         - ``unicode_blocks``: dict[str, int] per-block coverage counts (or error dict)
@@ -647,6 +1503,10 @@ def _fonttools_extract_from_tt(
         container: Container type string.
         tt: An open TTFont object for the face.
         ttc_index: TTC face index, or ``None``.
+        shared: Optional memo shared by the faces of one collection. Results
+            derived from the ``cmap``, ``GSUB`` and ``GPOS`` tables are
+            stored under the tables' directory records, so faces pointing
+            at the same table data compute them only once.
 
     Returns:
         A dictionary describing the extracted metadata for a single face.
@@ -654,7 +1514,7 @@ def _fonttools_extract_from_tt(
     data: dict[str, Any] = {"ok": True, "container": container, "ttc_index": ttc_index}
 
     try:
-        data["tables"] = sorted(tt.keys())
+        data["tables"] = table_tags(tt)
     except Exception:
         data["tables"] = []
 
@@ -673,45 +1533,41 @@ def _fonttools_extract_from_tt(
     except Exception as e:
         data["names"] = {"error": f"name: {e}"}
 
+    # Read from the open face so that build_font_descriptor() does not have
+    # to re-open the file (once per face for TTC collections).
     try:
-        data["os2"] = extract_os2_table(tt)
-    except Exception as e:
-        data["os2"] = {"error": f"OS/2: {e}"}
+        data["sample_text"] = extract_sample_text_from_tt(tt)
+    except Exception:
+        data["sample_text"] = None
 
-    # -------------------------------
-    # Unicode coverage (min/max/count)
-    # -------------------------------
     try:
-        data["unicode"] = extract_unicode_coverage(tt)
+        data["os2"] = extract_os2_table(tt)
     except Exception as e:
-        data["unicode"] = {"error": f"unicode: {e}"}
+        data["os2"] = {"error": f"OS/2: {e}"}
 
     # -------------------------------
-    # Unicode blocks
+    # Unicode coverage (min/max/count) and blocks
     # -------------------------------
     # We do not store the full cmap, but we can count coverage per Unicode block.
     # This is essential for robust CJK/emoji/script inference later.
-    try:
-        codepoints: set[int] = set()
-        if "cmap" in tt:
-            cmap = tt["cmap"]
-            for sub in cmap.tables:  # type: ignore[attr-defined]
-                if not sub.isUnicode():
-                    continue
-                # sub.cmap is {codepoint:int -> glyphName:str}
-                for cp in sub.cmap.keys():  # type: ignore[attr-defined]
-                    codepoints.add(int(cp))
-                    # Guard rail: avoid pathological fonts exploding memory
-                    if len(codepoints) >= 200_000:
-                        break
-                if len(codepoints) >= 200_000:
-                    break
-
-        data["unicode_blocks"] = (
-            compute_unicode_blocks(codepoints) if codepoints else {}
-        )
-    except Exception as e:
-        data["unicode_blocks"] = {"error": f"unicode_blocks: {e}"}
+    # Both summaries are derived from a single sorted code point list.
+    coverage_key = _shared_table_key(tt, "cmap") if shared is not None else None
+    if coverage_key is not None and coverage_key in shared:
+        unicode, blocks = shared[coverage_key]
+        data["unicode"], data["unicode_blocks"] = dict(unicode), dict(blocks)
+    else:
+        try:
+            codepoints = unicode_codepoints(tt)
+        except Exception as e:
+            data["unicode"] = {"error": f"unicode: {e}"}
+            data["unicode_blocks"] = {"error": f"unicode_blocks: {e}"}
+        else:
+            data["unicode"] = summarize_codepoints(codepoints) if "cmap" in tt else {}
+            data["unicode_blocks"] = (
+                compute_unicode_blocks(codepoints) if codepoints else {}
+            )
+            if coverage_key is not None:
+                shared[coverage_key] = (data["unicode"], data["unicode_blocks"])
 
     try:
         data["variable"] = {"fvar": ("fvar" in tt), "STAT": ("STAT" in tt)}
@@ -723,16 +1579,43 @@ def _fonttools_extract_from_tt(
     except Exception:
         data["color_tables"] = []
 
-    try:
-        data["opentype_features"] = extract_opentype_features(tt)
-    except Exception:
-        data["opentype_features"] = []
+    features_key = _shared_table_key(tt, "GSUB", "GPOS") if shared is not None else None
+    if features_key is not None and features_key in shared:
+        data["opentype_features"] = list(shared[features_key])
+    else:
+        try:
+            data["opentype_features"] = extract_opentype_features(tt)
+        except Exception:
+            data["opentype_features"] = []
+        if features_key is not None:
+            shared[features_key] = data["opentype_features"]
 
     return data
 
 
+def _shared_table_key(tt: TTFont, *tags: str) -> tuple | None:
+    """Return a memo key for results derived from ``tags`` of one face.
+
+    The key is built from the sfnt directory records (offset and length)
+    of the tables, which are equal for faces of a collection that share
+    the table data. Returns ``None`` if the directory is not available.
+    """
+    reader = getattr(tt, "reader", None)
+    if reader is None:
+        return None
+    records = []
+    for tag in tags:
+        entry = reader.tables.get(tag)
+        records.append(None if entry is None else (entry.offset, entry.length))
+    return (*tags, *records)
+
+
 def fonttools_extract_all(
-    path: Path, cache_dir: Path, use_cache: bool = True
+    path: Path,
+    cache_dir: Path,
+    use_cache: bool = True,
+    *,
+    file_id: str | None = None,
 ) -> list[dict[str, Any]]:
     """Extract fontTools metadata for one file, returning one entry per face.
 
@@ -742,12 +1625,14 @@ def fonttools_extract_all(
     - If ``fontTools`` is unavailable, returns a single error block.
 
     Caching:
-        Per-face JSON blocks are cached in ``cache_dir`` using :func:`font_cache_key`.
+        Per-face blocks are cached in a SQLite database in ``cache_dir``
+        (see :func:`cache_get`), keyed by :func:`font_cache_key`.
 
     Args:
         path: Font file path.
-        cache_dir: Directory used for per-face JSON cache files.
-        use_cache: If ``True``, reuse cached JSON blocks where possible.
+        cache_dir: Directory holding the per-face cache database.
+        use_cache: If ``True``, reuse cached blocks where possible.
+        file_id: Precomputed :func:`_file_cache_id` for ``path``.
 
     Returns:
         A list of dictionaries, each describing a single face.
@@ -756,26 +1641,28 @@ def fonttools_extract_all(
     # -------------------------------
     # Guard: fontTools not available
     # -------------------------------
+    header = read_font_header(path)
+    container = detect_font_container(path, header)
     if not FONTTOOLS_AVAILABLE:
         return [
             {
                 "ok": False,
-                "container": detect_font_container(path),
+                "container": container,
                 "ttc_index": None,
                 "error": "fontTools not available",
             }
         ]
-    container = detect_font_container(path)
+
+    if file_id is None:
+        file_id = _file_cache_id(path)
 
     # Single-face formats
     if container != "TTC":
-        key = font_cache_key(path, None)
-        cache_file = cache_dir / f"{key}.json"
-        if use_cache and cache_file.exists():
-            try:
-                return [json.loads(cache_file.read_text(encoding="utf-8"))]
-            except Exception:
-                pass
+        key = font_cache_key(path, None, file_id=file_id)
+        if use_cache:
+            cached = cache_get(cache_dir, key)
+            if cached is not None:
+                return [cached]
 
         out: dict[str, Any] = {"ok": False, "container": container, "ttc_index": None}
         try:
@@ -787,13 +1674,39 @@ def fonttools_extract_all(
             out["ok"] = False
             out["error"] = f"Cannot open font: {e}"
 
-        cache_file.write_text(json.dumps(out, indent=2), encoding="utf-8")
+        cache_put(cache_dir, key, out)
         return [out]
 
     # TTC formats (multi-face)
     results: list[dict[str, Any]] = []
+
+    # Warm path: answer from the cache without opening the collection,
+    # using the face count from the TTC header.
+    cached_faces: list[Any] = []
+    if use_cache:
+        header_count = ttc_face_count(path, header) or 0
+        for idx in range(header_count):
+            cached = cache_get(cache_dir, font_cache_key(path, idx, file_id=file_id))
+            if cached is None:
+                break
+            cached_faces.append(cached)
+        if cached_faces and len(cached_faces) == header_count:
+            for idx, cached in enumerate(cached_faces):
+                if isinstance(cached, dict):
+                    cached.setdefault("container", "TTC")
+                    cached.setdefault("ttc_index", idx)
+                    cached.setdefault("ttc_count", header_count)
+            return cached_faces
+        # A collection that could not be opened last time
+        failed = cache_get(cache_dir, font_cache_key(path, None, file_id=file_id))
+        if failed is not None:
+            return [failed]
+
     try:
-        col = TTCollection(path)
+        # Single lazy open: faces share the file handle and only the tables
+        # actually touched are decompiled. Tables stored once for several
+        # faces (common in CJK collections) are decompiled once.
+        col = TTCollection(path, lazy=True, shareTables=True)
     except Exception as e:
         out = {
             "ok": False,
@@ -802,31 +1715,27 @@ def fonttools_extract_all(
             "error": f"Cannot open TTC: {e}",
         }
         # cache file-level error
-        key = font_cache_key(path, None)
-        (cache_dir / f"{key}.json").write_text(
-            json.dumps(out, indent=2), encoding="utf-8"
-        )
+        cache_put(cache_dir, font_cache_key(path, None, file_id=file_id), out)
         return [out]
 
     ttc_count = len(col.fonts)
+    pending: list[tuple[str, Any]] = []
+    shared: dict[tuple, Any] = {}
     for idx, tt in enumerate(col.fonts):
-        key = font_cache_key(path, idx)
-        cache_file = cache_dir / f"{key}.json"
-        if use_cache and cache_file.exists():
-            try:
-                cached = json.loads(cache_file.read_text(encoding="utf-8"))
+        key = font_cache_key(path, idx, file_id=file_id)
+        if use_cache:
+            cached = cached_faces[idx] if idx < len(cached_faces) else None
+            if cached is not None:
                 if isinstance(cached, dict):
                     cached.setdefault("container", "TTC")
                     cached.setdefault("ttc_index", idx)
                     cached.setdefault("ttc_count", ttc_count)
                 results.append(cached)
                 continue
-            except Exception:
-                pass
 
         try:
             out = _fonttools_extract_from_tt(
-                path=path, container="TTC", tt=tt, ttc_index=idx
+                path=path, container="TTC", tt=tt, ttc_index=idx, shared=shared
             )
             out["ttc_count"] = ttc_count
         except Exception as e:
@@ -838,12 +1747,138 @@ def fonttools_extract_all(
                 "error": f"TTC face extract failed: {e}",
             }
 
-        cache_file.write_text(json.dumps(out, indent=2), encoding="utf-8")
+        pending.append((key, out))
         results.append(out)
 
+    cache_put_many(cache_dir, pending)
     return results
 
 
+@functools.lru_cache(maxsize=128)
+def _extract_cached(
+    path_str: str, file_id: str, cache_dir_str: str
+) -> tuple[dict[str, Any], ...]:
+    """In-process memo of :func:`fonttools_extract_all`, keyed by file id.
+
+    Bounded, so that a full inventory run does not keep every face alive.
+    """
+    return tuple(
+        fonttools_extract_all(
+            Path(path_str), cache_dir=Path(cache_dir_str), file_id=file_id
+        )
+    )
+
+
+def fonttools_extract_cached(
+    path: Path,
+    cache_dir: Path,
+    use_cache: bool = True,
+    st: os.stat_result | None = None,
+) -> list[dict[str, Any]]:
+    """Like :func:`fonttools_extract_all`, memoized within the current process.
+
+    Repeated calls for an unchanged file (same path, ``st_mtime_ns`` and
+    size) skip both the font parsing and the on-disk cache. Only recently
+    used files are remembered, and callers get their own copies of the face
+    dictionaries. With ``use_cache=False`` the memo is bypassed entirely.
+
+    Args:
+        path: Font file path.
+        cache_dir: Directory holding the per-face cache database.
+        use_cache: If ``True``, reuse in-process and on-disk results.
+        st: ``stat`` result for ``path``, if the caller already has one.
+
+    Returns:
+        A list of dictionaries, each describing a single face.
+    """
+    file_id = _file_cache_id(path, st)
+    if not use_cache:
+        return fonttools_extract_all(
+            path, cache_dir=cache_dir, use_cache=False, file_id=file_id
+        )
+    return copy.deepcopy(list(_extract_cached(str(path), file_id, str(cache_dir))))
+
+
+def extract_font_file(
+    font_path: Path,
+    st: os.stat_result | None = None,
+    *,
+    cache_dir: Path,
+    use_cache: bool = True,
+    include_charset: bool = False,
+    query_fontconfig: bool = True,
+) -> tuple[dict[str, Any] | None, list[dict[str, Any]]]:
+    """Run all per-file extraction steps for one font file.
+
+    This bundles the FontConfig enrichment (Linux only) and the per-face
+    fontTools extraction so that the whole unit of work can be scheduled on
+    a worker thread. Failures are folded into the returned blocks; this
+    function does not raise.
+
+    Args:
+        font_path: Font file path.
+        st: ``stat`` result for ``font_path`` from discovery, if available.
+        cache_dir: Directory holding the per-face cache database.
+        use_cache: If ``True``, reuse cached fontTools blocks.
+        include_charset: Forwarded to :func:`fc_query_extract`.
+        query_fontconfig: If ``False``, skip ``fc-query`` (the caller already
+            has the FontConfig data, see :func:`fc_list_extract`).
+
+    Returns:
+        A ``(fontconfig, faces)`` tuple, where ``fontconfig`` is ``None`` when
+        FontConfig data is unavailable.
+    """
+    # Linux-only FontConfig enrichment (file-level)
+    fontconfig: dict[str, Any] | None = None
+    if IS_LINUX and query_fontconfig:
+        try:
+            fontconfig = fc_query_extract(font_path, include_charset=include_charset)
+        except Exception:
+            fontconfig = None
+
+    # fontTools extraction (per face)
+    try:
+        faces = fonttools_extract_cached(
+            font_path,
+            cache_dir=cache_dir,
+            use_cache=use_cache,
+            st=st,
+        )
+    except Exception as e:
+        faces = [
+            {
+                "ok": False,
+                "container": detect_font_container(font_path),
+                "ttc_index": None,
+                "error": f"Extraction failed: {e}",
+            }
+        ]
+
+    return fontconfig, faces
+
+
+def _make_executor(jobs: int, *, processes: bool = False) -> Executor:
+    """Return the executor used for per-file extraction.
+
+    Threads are the default: most of the time goes to file I/O and
+    ``fc-query`` subprocesses. With ``processes=True`` the fontTools parsing
+    itself runs in parallel, which pays off on cold caches with many cores.
+    A process pool is never used on single-CPU machines, where it would only
+    add start-up and pickling overhead.
+
+    Args:
+        jobs: Maximum number of workers.
+        processes: If ``True``, prefer a process pool.
+
+    Returns:
+        A ``concurrent.futures`` executor.
+    """
+    workers = max(1, jobs)
+    if processes and (os.cpu_count() or 1) > 1:
+        return ProcessPoolExecutor(max_workers=min(workers, os.cpu_count() or 1))
+    return ThreadPoolExecutor(max_workers=workers)
+
+
 # -----------------------
 # Descriptor build
 # -----------------------
@@ -926,11 +1961,9 @@ def build_font_descriptor(
     Returns:
         A dictionary representing the canonical font descriptor.
     """
-    names: dict[str, list[str]] = (
-        fonttools.get("names", {})
-        if isinstance(fonttools.get("names", {}), dict)
-        else {}
-    )
+    names = fonttools.get("names")
+    if not isinstance(names, dict):
+        names = {}
 
     # -------------------------------
     # Identity (names + file)
@@ -945,7 +1978,11 @@ def build_font_descriptor(
     # -------------------------------
     sample_text = None
     try:
-        samples = extract_sample_text(str(font_path))
+        if "sample_text" in fonttools:
+            samples = fonttools["sample_text"]
+        else:
+            # Cache entries written before sample_text was extracted per face
+            samples = extract_sample_text(str(font_path))
         if samples:
             sample_text = {
                 "source": "font",
@@ -977,7 +2014,10 @@ def build_font_descriptor(
     # -------------------------------
     # Format and container properties
     # -------------------------------
-    container = fonttools.get("container", detect_font_container(font_path))
+    # Only sniff the file header when the fontTools block has no container
+    container = fonttools.get("container")
+    if container is None:
+        container = detect_font_container(font_path)
     font_type = fonttools.get("font_type", "Unknown")
     variable_flags = fonttools.get("variable", {}) or {}
     variable = bool(
@@ -993,17 +2033,15 @@ def build_font_descriptor(
     unicode_block = fonttools.get("unicode", {}) or {}
     unicode_max = unicode_block.get("max")
 
+    unicode_blocks = fonttools.get("unicode_blocks")
+
     coverage = {
         "unicode": {
             "count": int(unicode_block.get("count", 0) or 0),
             "min": unicode_block.get("min"),
             "max": unicode_max,
         },
-        "unicode_blocks": (
-            fonttools.get("unicode_blocks", {})
-            if isinstance(fonttools.get("unicode_blocks"), dict)
-            else {}
-        ),
+        "unicode_blocks": unicode_blocks if isinstance(unicode_blocks, dict) else {},
         "scripts": scripts,
         "languages": languages,
         "charset": charset,
@@ -1012,17 +2050,16 @@ def build_font_descriptor(
     # -------------------------------
     # Typography (metrics + features)
     # -------------------------------
+    os2 = fonttools.get("os2")
+    if not isinstance(os2, dict) or "error" in os2:
+        os2 = {}
+
     typography = {
-        "weight_class": None,
-        "width_class": None,
+        "weight_class": os2.get("weight_class"),
+        "width_class": os2.get("width_class"),
         "opentype_features": fonttools.get("opentype_features", []) or [],
     }
 
-    os2 = fonttools.get("os2", {})
-    if isinstance(os2, dict) and "error" not in os2:
-        typography["weight_class"] = os2.get("weight_class")
-        typography["width_class"] = os2.get("width_class")
-
     # -------------------------------
     # Format summary and classification
     # -------------------------------
@@ -1044,12 +2081,6 @@ def build_font_descriptor(
     license_text = _best_name(names, NAME_ID_LICENSE)
     license_url = _best_name(names, NAME_ID_LICENSE_URL)
 
-    vendor = None
-    embedding_rights = None
-    if isinstance(os2, dict) and "error" not in os2:
-        vendor = os2.get("vendor_id")
-        embedding_rights = os2.get("embedding_rights")
-
     return {
         "identity": {
             "file": str(font_path),
@@ -1065,8 +2096,8 @@ def build_font_descriptor(
         "typography": typography,
         "classification": classification,
         "license": {"text": license_text, "url": license_url},
-        "vendor": vendor,
-        "embedding_rights": embedding_rights,
+        "vendor": os2.get("vendor_id"),
+        "embedding_rights": os2.get("embedding_rights"),
         "sample_text": sample_text,
         "source": {
             "fonttools": {
@@ -1078,6 +2109,185 @@ def build_font_descriptor(
     }
 
 
+def iter_font_descriptors(
+    font_files: list[Path],
+    results: Iterable[tuple[dict[str, Any] | None, list[dict[str, Any]]]],
+    platform_name: str,
+    *,
+    verbose: bool = False,
+    previous: dict[str, list[dict[str, Any]]] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Yield one descriptor per face, in discovery order.
+
+    Descriptor build failures are reported as minimal error entries instead
+    of aborting the dump. Files listed in ``previous`` take no entry from
+    ``results``; their earlier descriptors are yielded unchanged.
+
+    Args:
+        font_files: Font files in discovery order.
+        results: ``(fontconfig, faces)`` tuples as returned by
+            :func:`extract_font_file`, one per file not in ``previous``, in
+            discovery order. Consumed lazily, so descriptors are yielded
+            while extraction is still running.
+        platform_name: Normalized platform identifier.
+        verbose: If ``True``, print each processed file.
+        previous: Reusable descriptors by file path, as returned by
+            :func:`load_reusable_descriptors`.
+
+    Yields:
+        Canonical font descriptors (see :func:`build_font_descriptor`).
+    """
+    results = iter(results)
+    for font_path in font_files:
+        if previous and str(font_path) in previous:
+            yield from previous[str(font_path)]
+            continue
+        fontconfig, faces = next(results)
+        if verbose:
+            print(f"Processing: {font_path}")
+
+        for face in faces:
+            try:
+                yield build_font_descriptor(
+                    font_path=font_path,
+                    platform_name=platform_name,
+                    fonttools=face,
+                    fontconfig=fontconfig,
+                )
+            except Exception as e:
+                yield {
+                    "identity": {
+                        "file": str(font_path),
+                        "ttc_index": face.get("ttc_index"),
+                    },
+                    "error": f"Descriptor build failed: {e}",
+                }
+
+
+# -----------------------
+# Incremental runs
+# -----------------------
+# Manifest options that change how the inventory is written, not the
+# descriptors themselves; they do not prevent ``--incremental`` reuse.
+OUTPUT_ONLY_OPTIONS = ("format", "compact", "gzip")
+
+
+def manifest_path_for(output: Path) -> Path:
+    """Return the manifest file written next to ``output``."""
+    return output.with_name(output.name + ".manifest.json")
+
+
+def build_manifest(
+    font_files: list[Path],
+    stats: dict[Path, os.stat_result],
+    options: dict[str, Any],
+) -> dict[str, Any]:
+    """Describe the font files an inventory was built from.
+
+    Data structure::
+
+        {
+          "options": {...},  # output format and settings affecting content
+          "files": {"/path/font.ttf": [mtime_ns, size], ...}
+        }
+
+    Unreadable files are left out, so they are never reused.
+    """
+    return {
+        "options": options,
+        "files": {
+            str(p): [stats[p].st_mtime_ns, stats[p].st_size]
+            for p in font_files
+            if p in stats
+        },
+    }
+
+
+def inventory_is_up_to_date(
+    output: Path,
+    font_files: list[Path],
+    stats: dict[Path, os.stat_result],
+    options: dict[str, Any],
+) -> bool:
+    """Return ``True`` if ``output`` was built from exactly these inputs.
+
+    This is a cheap warm-start check: the manifest written next to the
+    inventory must list the same font files with the same ``(mtime_ns,
+    size)`` and the same output options. Added, removed or modified font
+    files, as well as any change of options, force a rebuild.
+
+    Args:
+        output: Path of the inventory file.
+        font_files: Font files returned by :func:`get_installed_font_files`.
+        stats: :func:`stat_font_files` result for ``font_files``.
+        options: Options that shape the output (see :func:`build_manifest`).
+
+    Returns:
+        ``True`` if the existing inventory can be reused as-is.
+    """
+    try:
+        manifest = load_json(manifest_path_for(output).read_bytes())
+    except (OSError, ValueError):
+        return False
+    if not output.is_file():
+        return False
+    return manifest == build_manifest(font_files, stats, options)
+
+
+def load_reusable_descriptors(
+    output: Path,
+    stats: dict[Path, os.stat_result],
+    options: dict[str, Any],
+) -> dict[str, list[dict[str, Any]]]:
+    """Return the previous descriptors of font files that did not change.
+
+    Reads the inventory at ``output`` and its manifest (see
+    :func:`build_manifest`). A file's descriptors are reusable when its
+    current ``(mtime_ns, size)`` matches the manifest. The previous
+    inventory is parsed in the format recorded in the manifest. Nothing is
+    reused if either file is missing or unreadable, or if ``options`` that
+    affect descriptor content (all but :data:`OUTPUT_ONLY_OPTIONS`) differ
+    from those the inventory was written with.
+
+    Returns:
+        Mapping ``{file_path_str: [descriptor, ...]}``.
+    """
+    try:
+        manifest = load_json(manifest_path_for(output).read_bytes())
+        raw = output.read_bytes()
+    except (OSError, ValueError):
+        return {}
+    old_options = manifest.get("options") if isinstance(manifest, dict) else None
+    if not isinstance(old_options, dict):
+        return {}
+    content_keys = (set(old_options) | set(options)) - set(OUTPUT_ONLY_OPTIONS)
+    if any(old_options.get(k) != options.get(k) for k in content_keys):
+        return {}
+
+    try:
+        if raw[:2] == GZIP_MAGIC:
+            raw = gzip.decompress(raw)
+        if old_options.get("format") == "ndjson":
+            fonts = [load_json(line) for line in raw.splitlines()[1:] if line]
+        else:
+            fonts = load_json(raw).get("fonts", [])
+    except (OSError, ValueError, AttributeError, EOFError):
+        return {}
+
+    files = manifest.get("files") or {}
+    unchanged = {
+        str(p)
+        for p, st in stats.items()
+        if files.get(str(p)) == [st.st_mtime_ns, st.st_size]
+    }
+    previous: dict[str, list[dict[str, Any]]] = {}
+    for desc in fonts:
+        file = (desc.get("identity") or {}).get("file")
+        if file in unchanged:
+            previous.setdefault(file, []).append(desc)
+    return previous
+
+
 # -----------------------
 # Main
 # -----------------------
@@ -1104,24 +2314,62 @@ def main() -> None:
         "--output",
         type=Path,
         default=Path("font_inventory.json"),
-        help="Output JSON file",
+        help="Output JSON file, or - for standard output",
     )
     parser.add_argument(
         "--cache-dir",
         type=Path,
         default=Path(".fontshow_cache"),
-        help="Directory used to cache per-face fontTools results",
+        help="Directory holding the per-face fontTools cache database",
     )
     parser.add_argument(
         "--no-cache",
         action="store_true",
-        help="Disable fontTools cache reuse",
+        help="Disable fontTools cache reuse (also forces a full rebuild)",
     )
     parser.add_argument(
         "--include-fc-charset",
         action="store_true",
         help="Include Fontconfig-declared Unicode charset information (experimental, best-effort)",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=min(32, (os.cpu_count() or 1) * 4),
+        help="Number of worker threads used for per-file extraction",
+    )
+    parser.add_argument(
+        "--processes",
+        action="store_true",
+        help="Run per-file extraction in worker processes instead of threads",
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Write the json format without indentation",
+    )
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        help="Compress the output with gzip",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse descriptors of unchanged files from the previous output",
+    )
+    parser.add_argument(
+        "--prefetch",
+        action="store_true",
+        help="Hint the kernel to read font files ahead of extraction (Linux)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("json", "ndjson"),
+        default="json",
+        help="Output format: a single JSON document, or one JSON object per line",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -1130,10 +2378,46 @@ def main() -> None:
 
     args = parser.parse_args()
 
+    # "-o -" streams the inventory to another process, e.g. with --format
+    # ndjson; stdout then carries nothing but the inventory.
+    to_stdout = str(args.output) == "-"
+    if to_stdout and (args.verbose or args.incremental):
+        parser.error("--output - cannot be combined with --verbose or --incremental")
+
     platform_name = platform.system().lower()
     cache_dir = args.cache_dir
     cache_dir.mkdir(parents=True, exist_ok=True)
 
+    # -------------------------------
+    # Font discovery
+    # -------------------------------
+    font_files = get_installed_font_files()
+
+    if args.verbose:
+        print(f"Discovered {len(font_files)} font files")
+
+    # One stat per file, shared by the up-to-date check and the scheduling
+    stats = stat_font_files(font_files)
+
+    # Everything that shapes the output; recorded in the manifest
+    options = {
+        "format": args.format,
+        "compact": bool(args.compact),
+        "gzip": bool(args.gzip),
+        "include_fc_charset": bool(args.include_fc_charset and IS_LINUX),
+        "cache_format": CACHE_FORMAT_VERSION,
+        "tool_version": FONTSHOW_VERSION,
+    }
+
+    # Warm start: same font files and options as the last run
+    if (
+        not args.no_cache
+        and not to_stdout
+        and inventory_is_up_to_date(args.output, font_files, stats, options)
+    ):
+        print(f"OK: {args.output} is up to date")
+        return
+
     inventory: dict[str, Any] = {
         "metadata": {
             "schema_version": "1.0",
@@ -1147,76 +2431,99 @@ def main() -> None:
         "fonts": [],
     }
 
-    # -------------------------------
-    # Font discovery
-    # -------------------------------
-    font_files = get_installed_font_files()
-
-    if args.verbose:
-        print(f"Discovered {len(font_files)} font files")
+    # Incremental run: files unchanged since the previous inventory keep
+    # their descriptors and skip extraction entirely.
+    previous: dict[str, list[dict[str, Any]]] = {}
+    if args.incremental and not args.no_cache:
+        previous = load_reusable_descriptors(args.output, stats, options)
+    to_extract = [p for p in font_files if str(p) not in previous]
+    if args.verbose and args.incremental:
+        print(f"Reusing {len(font_files) - len(to_extract)} unchanged font files")
 
     # -------------------------------
     # Extraction pipeline
     # -------------------------------
-    for font_path in font_files:
-        if args.verbose:
-            print(f"Processing: {font_path}")
-
-        # Linux-only FontConfig enrichment (file-level)
-        fontconfig: dict[str, Any] | None = None
-        if IS_LINUX:
-            try:
-                fontconfig = fc_query_extract(
-                    font_path, include_charset=args.include_fc_charset
-                )
-            except Exception:
-                fontconfig = None
-
-        # fontTools extraction (per face)
-        try:
-            faces = fonttools_extract_all(
-                font_path,
-                cache_dir=cache_dir,
-                use_cache=not args.no_cache,
+    # Per-file extraction is I/O-bound (font opens, fc-query subprocesses),
+    # so it runs on a thread pool. ``Executor.map`` preserves input order,
+    # keeping the inventory deterministic.
+    #
+    # FontConfig data comes from a single batched fc-list call. The charset
+    # is only available from fc-query, which is then run in batches.
+    fc_map = None
+    if IS_LINUX and to_extract:
+        if args.include_fc_charset:
+            fc_map = fc_query_extract_batch(to_extract, include_charset=True)
+        else:
+            fc_map = fc_list_extract()
+    extract = functools.partial(
+        extract_font_file,
+        cache_dir=cache_dir,
+        use_cache=not args.no_cache,
+        include_charset=args.include_fc_charset,
+        query_fontconfig=fc_map is None,
+    )
+    #
+    # Files are read in (device, inode) order to favour sequential disk
+    # access; descriptors are still emitted in discovery order. When
+    # streaming to stdout, discovery order is kept so that the first fonts
+    # are not held back behind files that sort earlier on disk.
+    #
+    # Byte-identical copies of a font are extracted once and share the result.
+    canonical = identical_file_map(to_extract, stats)
+    schedule = list(dict.fromkeys(canonical[p] for p in to_extract))
+    if not to_stdout:
+        schedule.sort(key=lambda p: disk_order_key(p, stats.get(p)))
+    if args.prefetch:
+        prefetch_font_files(schedule)
+    with _make_executor(args.jobs, processes=args.processes) as executor:
+        chunksize = max(1, len(schedule) // (max(1, args.jobs) * 4))
+        extracted = executor.map(
+            extract,
+            schedule,
+            [stats.get(p) for p in schedule],
+            chunksize=chunksize,
+        )
+        # Results are consumed as they arrive: descriptors are written while
+        # later files are still being extracted.
+        results = iter_in_discovery_order(to_extract, canonical, schedule, extracted)
+        if fc_map is not None:
+            results = (
+                (fc_map.get(p), faces)
+                for p, (_, faces) in zip(to_extract, results, strict=True)
             )
-        except Exception as e:
-            faces = [
-                {
-                    "ok": False,
-                    "container": detect_font_container(font_path),
-                    "ttc_index": None,
-                    "error": f"Extraction failed: {e}",
-                }
-            ]
 
-        # Build descriptors
-        for face in faces:
-            try:
-                desc = build_font_descriptor(
-                    font_path=font_path,
-                    platform_name=platform_name,
-                    fonttools=face,
-                    fontconfig=fontconfig,
-                )
-                inventory["fonts"].append(desc)
-            except Exception as e:
-                inventory["fonts"].append(
-                    {
-                        "identity": {
-                            "file": str(font_path),
-                            "ttc_index": face.get("ttc_index"),
-                        },
-                        "error": f"Descriptor build failed: {e}",
-                    }
+        descriptors = iter_font_descriptors(
+            font_files,
+            results,
+            platform_name,
+            verbose=args.verbose,
+            previous=previous,
+        )
+
+        # -------------------------------
+        # Write output
+        # -------------------------------
+        with open_output(args.output, compress=args.gzip) as f:
+            if args.format == "ndjson":
+                # One compact JSON document per line: the metadata header
+                # first, then each descriptor as soon as it is built. On
+                # stdout every line is flushed, so a reader gets each font as
+                # soon as its extraction finishes.
+                f.write(dump_json({"metadata": inventory["metadata"]}))
+                f.write(b"\n")
+                for desc in descriptors:
+                    f.write(dump_json(desc))
+                    f.write(b"\n")
+                    if to_stdout:
+                        f.flush()
+            else:
+                write_inventory_json(
+                    f, inventory["metadata"], descriptors, indent=not args.compact
                 )
 
-    # -------------------------------
-    # Write output
-    # -------------------------------
-    args.output.write_text(
-        json.dumps(inventory, indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
+    if not to_stdout:
+        with open_output(manifest_path_for(args.output)) as f:
+            f.write(dump_json(build_manifest(font_files, stats, options)))
 
     if args.verbose:
         print(f"OK: wrote inventory to {args.output}")
@@ -17,11 +17,28 @@ Default inference level: ``medium``.
 """
 
 import argparse
+import bisect
+import functools
+import gzip
 import json
+import math
+import mmap
+import os
 import sys
 from pathlib import Path
 from typing import Any
 
+try:
+    # Optional fast JSON decoder; parses bytes directly.
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+#: First bytes of a gzip stream.
+GZIP_MAGIC = b"\x1f\x8b"
+
 # ============================================================
 # Inference thresholds
 # ============================================================
@@ -48,6 +65,17 @@ INFERENCE_THRESHOLDS: dict[str, dict[str, int]] = {
     },
 }
 
+#: Mapping of inference level → ``(min_count, min_percent)`` used by
+#: :func:`infer_scripts` to decide whether a Unicode block is significant:
+#: a block counts if it has at least ``min_count`` code points or at least
+#: ``min_percent`` % of all covered code points (``None``: no relative test).
+#: Unknown levels use the ``"medium"`` thresholds.
+BLOCK_SIGNIFICANCE: dict[str, tuple[int, int | None]] = {
+    "conservative": (50, 10),
+    "medium": (20, 5),
+    "aggressive": (5, None),
+}
+
 # ============================================================
 # Unicode → script ranges
 # ============================================================
@@ -271,6 +299,72 @@ SCRIPT_NAME_TO_ISO: dict[str, str] = {
     "han": "hani",
 }
 
+#: Exact Unicode block name → internal script name, used by
+#: :func:`infer_scripts`. Blocks whose names start with ``"Latin"`` or
+#: ``"CJK Unified Ideographs"`` are matched by prefix instead.
+BLOCK_TO_SCRIPT: dict[str, str] = {
+    "Greek and Coptic": "greek",
+    "Cyrillic": "cyrillic",
+    "Arabic": "arabic",
+    "Hebrew": "hebrew",
+    "Devanagari": "devanagari",
+    "Hiragana": "japanese",
+    "Katakana": "japanese",
+    "Hangul Syllables": "korean",
+}
+
+#: Fallback ``unicode.max`` → script table used by :func:`infer_scripts`.
+#: ``_FALLBACK_BOUNDS`` holds sorted inclusive upper bounds; the script for a
+#: value is ``_FALLBACK_SCRIPTS[bisect_left(_FALLBACK_BOUNDS, value)]``
+#: (``None`` for gaps, last entry for anything above the last bound).
+_FALLBACK_BOUNDS: tuple[int, ...] = (
+    0x024F,
+    0x036F,
+    0x03FF,
+    0x04FF,
+    0x058F,
+    0x05FF,
+    0x06FF,
+    0x08FF,
+    0x097F,
+    0x4DFF,
+)
+_FALLBACK_SCRIPTS: tuple[str | None, ...] = (
+    "latn",  # ... - U+024F
+    None,
+    "grek",  # U+0370 - U+03FF
+    "cyrl",  # U+0400 - U+04FF
+    None,
+    "hebr",  # U+0590 - U+05FF
+    "arab",  # U+0600 - U+06FF
+    None,
+    "deva",  # U+0900 - U+097F
+    None,
+    "hani",  # U+4E00 - ...
+)
+
+#: Bit per internal script name, used by :func:`infer_scripts` to collect
+#: scripts in an int mask. Bits follow the order of the ISO 15924 codes, so
+#: unpacking a mask with ``_ISO_BY_BIT`` yields an already sorted list.
+#: (``SCRIPT_NAME_TO_ISO`` is one-to-one, so no de-duplication is needed.)
+_SCRIPT_BITS: dict[str, int] = {
+    name: 1 << i
+    for i, name in enumerate(sorted(SCRIPT_NAME_TO_ISO, key=SCRIPT_NAME_TO_ISO.get))
+}
+_ISO_BY_BIT: tuple[tuple[int, str], ...] = tuple(
+    (bit, SCRIPT_NAME_TO_ISO[name]) for name, bit in _SCRIPT_BITS.items()
+)
+#: ``BLOCK_TO_SCRIPT`` resolved straight to script bits.
+_BLOCK_BITS: dict[str, int] = {
+    block: _SCRIPT_BITS[script] for block, script in BLOCK_TO_SCRIPT.items()
+}
+_LATIN_BIT = _SCRIPT_BITS["latin"]
+_HAN_BIT = _SCRIPT_BITS["han"]
+_JAPANESE_BIT = _SCRIPT_BITS["japanese"]
+_KOREAN_BIT = _SCRIPT_BITS["korean"]
+#: han + japanese together fix :func:`infer_scripts`' result (``jpan``).
+_HAN_JAPANESE = _HAN_BIT | _JAPANESE_BIT
+
 # NOTE:
 # Script identifiers emitted by infer_scripts() MUST be ISO 15924 codes.
 # Human-readable names (e.g. "latin", "greek") are considered internal-only
@@ -304,74 +398,57 @@ def infer_scripts(coverage: dict[str, Any], level: str = "medium") -> list[str]:
     # -------------------------------
     if blocks:
         total = sum(blocks.values()) or 1
+        min_count, min_percent = BLOCK_SIGNIFICANCE.get(
+            level, BLOCK_SIGNIFICANCE["medium"]
+        )
+        # count / total >= p / 100, without a float division per block;
+        # no relative threshold means it can never be met
+        min_scaled = min_percent * total if min_percent is not None else math.inf
 
-        def significant(count: int) -> bool:
-            """Check whether a block count is significant for the given level."""
-            if level == "conservative":
-                return count >= 50 or (count / total) >= 0.10
-            if level == "aggressive":
-                return count >= 5
-            # medium (default)
-            return count >= 20 or (count / total) >= 0.05
-
-        scripts_found: set[str] = set()
+        # Scripts found, as a mask of _SCRIPT_BITS
+        found = 0
+        # Bound method as a local: the loop below runs for every block
+        block_bit = _BLOCK_BITS.get
 
         # --- block → script mapping
         for block, count in blocks.items():
-            if not significant(count):
+            if count < min_count and count * 100 < min_scaled:
                 continue
 
-            if block.startswith("Latin"):
-                scripts_found.add("latin")
-            elif block == "Greek and Coptic":
-                scripts_found.add("greek")
-            elif block == "Cyrillic":
-                scripts_found.add("cyrillic")
-            elif block == "Arabic":
-                scripts_found.add("arabic")
-            elif block == "Hebrew":
-                scripts_found.add("hebrew")
-            elif block == "Devanagari":
-                scripts_found.add("devanagari")
-            elif block in ("Hiragana", "Katakana"):
-                scripts_found.add("japanese")
-            elif block == "Hangul Syllables":
-                scripts_found.add("korean")
-            elif block.startswith("CJK Unified Ideographs"):
-                scripts_found.add("han")
+            bit = block_bit(block)
+            if bit is None:
+                if block.startswith("Latin"):
+                    bit = _LATIN_BIT
+                elif block.startswith("CJK Unified Ideographs"):
+                    bit = _HAN_BIT
+                else:
+                    continue
+            found |= bit
+
+            # han + japanese decides the result ("jpan") whatever follows;
+            # han + korean does not, as japanese would still take precedence
+            if found & _HAN_JAPANESE == _HAN_JAPANESE:
+                break
 
         # --- CJK disambiguation
-        if "han" in scripts_found:
-            if "japanese" in scripts_found:
+        if found & _HAN_BIT:
+            if found & _JAPANESE_BIT:
                 return ["jpan"]
-            if "korean" in scripts_found:
+            if found & _KOREAN_BIT:
                 return ["hang"]
             return ["hani"]
 
-        # Normalize to ISO 15924 codes
-        normalized = [SCRIPT_NAME_TO_ISO.get(s, s) for s in scripts_found]
-
-        return sorted(set(normalized)) or ["unknown"]
+        # ISO 15924 codes, already in sorted order
+        return [iso for bit, iso in _ISO_BY_BIT if found & bit] or ["unknown"]
 
     # -------------------------------
     # 2. Fallback: unicode.max
     # -------------------------------
     unicode_max = coverage.get("unicode", {}).get("max")
     if isinstance(unicode_max, int):
-        if unicode_max <= 0x024F:
-            return ["latn"]
-        if 0x0370 <= unicode_max <= 0x03FF:
-            return ["grek"]
-        if 0x0400 <= unicode_max <= 0x04FF:
-            return ["cyrl"]
-        if 0x0590 <= unicode_max <= 0x05FF:
-            return ["hebr"]
-        if 0x0600 <= unicode_max <= 0x06FF:
-            return ["arab"]
-        if 0x0900 <= unicode_max <= 0x097F:
-            return ["deva"]
-        if unicode_max >= 0x4E00:
-            return ["hani"]
+        script = _FALLBACK_SCRIPTS[bisect.bisect_left(_FALLBACK_BOUNDS, unicode_max)]
+        if script is not None:
+            return [script]
 
     return ["unknown"]
 
@@ -386,10 +463,51 @@ def infer_languages(scripts: list[str]) -> list[str]:
     Returns:
         A sorted list of unique language codes.
     """
-    langs: list[str] = []
-    for script in scripts:
-        langs.extend(SCRIPT_TO_LANGUAGES.get(script, []))
-    return sorted(set(langs))
+    return list(_languages_for(frozenset(scripts)))
+
+
+@functools.cache
+def _languages_for(scripts: frozenset[str]) -> tuple[str, ...]:
+    # Only a few distinct script sets occur, so the sorted union is memoized
+    # (lazily: precomputing every combination would be mostly unused).
+    return tuple(
+        sorted({lang for s in scripts for lang in SCRIPT_TO_LANGUAGES.get(s, ())})
+    )
+
+
+def infer_coverage(
+    coverage: dict[str, Any], level: str = "medium"
+) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """
+    Infer ``(scripts, languages)`` for a coverage block, memoized.
+
+    Equivalent to :func:`infer_scripts` followed by :func:`infer_languages`.
+    Fonts of the same family usually share an identical block signature,
+    so results are cached on the inputs ``infer_scripts`` actually reads:
+    the ``unicode_blocks`` items, or ``unicode.max`` when there are none.
+
+    Returns:
+        Tuples, so that cached results cannot be mutated by callers.
+    """
+    blocks = coverage.get("unicode_blocks", {}) or {}
+    if blocks:
+        return _infer_cached(frozenset(blocks.items()), None, level)
+    unicode_max = (coverage.get("unicode", {}) or {}).get("max")
+    if not isinstance(unicode_max, int):
+        unicode_max = None
+    return _infer_cached(frozenset(), unicode_max, level)
+
+
+@functools.lru_cache(maxsize=4096)
+def _infer_cached(
+    blocks_key: frozenset[tuple[str, int]], unicode_max: int | None, level: str
+) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    coverage: dict[str, Any] = {
+        "unicode_blocks": dict(blocks_key),
+        "unicode": {"max": unicode_max},
+    }
+    scripts = infer_scripts(coverage, level)
+    return tuple(scripts), tuple(infer_languages(scripts))
 
 
 # ============================================================
@@ -397,7 +515,9 @@ def infer_languages(scripts: list[str]) -> list[str]:
 # ============================================================
 
 
-def parse_inventory(data: dict[str, Any], level: str) -> dict[str, Any]:
+def parse_inventory(
+    data: dict[str, Any], level: str, *, compact: bool = False
+) -> dict[str, Any]:
     """
     Enrich a font inventory with deterministic inference results.
 
@@ -408,16 +528,21 @@ def parse_inventory(data: dict[str, Any], level: str) -> dict[str, Any]:
 
         font["inference"] = {
             "level": str,
-            "scripts": list[str],
-            "languages": list[str],
+            "scripts": tuple[str, ...],
+            "languages": tuple[str, ...],
             "declared_scripts": list[str],
             "declared_languages": list[str],
             "unicode_blocks": dict[str, int],
         }
 
+    ``unicode_blocks`` is the same object as ``coverage["unicode_blocks"]``
+    (not a copy), but serializing it writes the block table twice.
+
     Args:
         data: Parsed JSON inventory as a Python dictionary.
         level: Inference aggressiveness level.
+        compact: Omit ``inference.unicode_blocks``; consumers should read
+            ``coverage.unicode_blocks`` instead.
 
     Returns:
         The same inventory dictionary, enriched in place.
@@ -425,20 +550,19 @@ def parse_inventory(data: dict[str, Any], level: str) -> dict[str, Any]:
     for font in data.get("fonts", []):
         coverage: dict[str, Any] = font.get("coverage", {}) or {}
 
-        declared_scripts: list[str] = coverage.get("scripts", [])
-        declared_languages: list[str] = coverage.get("languages", [])
+        # Shared, immutable tuples from the inference cache (serialized as
+        # JSON arrays), instead of fresh list copies per font
+        scripts, languages = infer_coverage(coverage, level)
 
-        inferred_scripts: list[str] = list(infer_scripts(coverage, level) or [])
-        inferred_languages: list[str] = list(infer_languages(inferred_scripts) or [])
-
-        font["inference"] = {
+        font["inference"] = inference = {
             "level": level,
-            "scripts": inferred_scripts,
-            "languages": inferred_languages,
-            "declared_scripts": declared_scripts,
-            "declared_languages": declared_languages,
-            "unicode_blocks": coverage.get("unicode_blocks", {}),
+            "scripts": scripts,
+            "languages": languages,
+            "declared_scripts": coverage.get("scripts", []),
+            "declared_languages": coverage.get("languages", []),
         }
+        if not compact:
+            inference["unicode_blocks"] = coverage.get("unicode_blocks", {})
 
     metadata = data.setdefault("metadata", {})
     metadata["inference_level"] = level
@@ -452,6 +576,71 @@ def parse_inventory(data: dict[str, Any], level: str) -> dict[str, Any]:
 # ============================================================
 
 
+def load_inventory(path: Path) -> Any:
+    """
+    Load an inventory JSON file, plain or gzip-compressed.
+
+    Uses ``orjson`` when installed, decoding straight from a read-only
+    memory map of the file (no in-memory copy of the raw bytes), and the
+    standard ``json`` module otherwise. Compressed inventories (as written
+    by ``dump_fonts --gzip``) are recognized by their magic bytes.
+    """
+    if ORJSON_AVAILABLE:
+        with open(path, "rb") as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # Empty files (and some special files) cannot be mapped
+                return orjson.loads(f.read())
+            with mm, memoryview(mm) as view:
+                if view[:2] == GZIP_MAGIC:
+                    return orjson.loads(gzip.decompress(view))
+                return orjson.loads(view)
+    raw = path.read_bytes()
+    if raw[:2] == GZIP_MAGIC:
+        raw = gzip.decompress(raw)
+    return json.loads(raw)
+
+
+def write_inventory(path: Path, data: Any) -> None:
+    """
+    Atomically write an inventory to `path` (see :func:`dump_inventory`).
+
+    The JSON is written to a temporary file next to `path` and then moved
+    over it, so `path` is never left half-written, even when it is also
+    the input being enriched (``--in-place``). If writing fails, the
+    temporary file is removed.
+    """
+    payload = dump_inventory(data)
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        tmp.write_bytes(payload)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def dump_inventory(data: Any) -> bytes:
+    """
+    Serialize an inventory as UTF-8 JSON indented by two spaces.
+
+    Uses ``orjson`` when installed, the standard ``json`` module otherwise.
+    Both keep non-ASCII text as-is and lay the document out identically;
+    ``orjson`` only spells float exponents differently (``1e20`` rather
+    than ``1e+20``) and writes non-finite floats as ``null``.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        except TypeError:
+            # Values orjson rejects (e.g. integers wider than 64 bits)
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
 def main() -> None:
     """CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -478,6 +667,19 @@ def main() -> None:
         default="medium",
         help="Inference aggressiveness level",
     )
+    parser.add_argument(
+        "--in-place",
+        action="store_true",
+        help="Enrich the input file itself (overrides --output)",
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help=(
+            "Do not repeat coverage.unicode_blocks inside each inference block "
+            "(smaller output)"
+        ),
+    )
     parser.add_argument(
         "--validate-inventory",
         action="store_true",
@@ -485,6 +687,8 @@ def main() -> None:
     )
 
     args = parser.parse_args()
+    if args.in_place:
+        args.output = args.input
 
     if not args.input.exists():
         print(f"❌ Error: input file not found: {args.input}", file=sys.stderr)
@@ -493,7 +697,7 @@ def main() -> None:
         )
         sys.exit(1)
 
-    data: dict[str, Any] = json.loads(args.input.read_text(encoding="utf-8"))
+    data: dict[str, Any] = load_inventory(args.input)
 
     # --- Soft schema validation ---
     metadata = data.setdefault("metadata", {})
@@ -516,12 +720,9 @@ def main() -> None:
         exit_code = validate_inventory(data)
         sys.exit(exit_code)
 
-    enriched = parse_inventory(data, args.infer_level)
+    enriched = parse_inventory(data, args.infer_level, compact=args.compact)
 
-    args.output.write_text(
-        json.dumps(enriched, indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
+    write_inventory(args.output, enriched)
 
     print(f"OK: wrote enriched inventory to {args.output}")
 
@@ -0,0 +1,34 @@
+import os
+
+from fontshow.create_catalog import catalog_cache_key, prune_catalog_cache
+
+
+def test_catalog_cache_key_tracks_inputs(tmp_path):
+    inventory = tmp_path / "inventory.json"
+    inventory.write_text('{"fonts": []}', encoding="utf-8")
+
+    key = catalog_cache_key(inventory, set(), None)
+
+    assert catalog_cache_key(inventory, set(), None) == key
+    assert catalog_cache_key(inventory, {"Noto"}, None) != key
+    assert catalog_cache_key(inventory, set(), 5) != key
+
+    inventory.write_text('{"fonts": [] }', encoding="utf-8")
+    assert catalog_cache_key(inventory, set(), None) != key
+
+
+def test_prune_catalog_cache_keeps_most_recent(tmp_path):
+    for i in range(5):
+        entry = tmp_path / f"catalog_{i}.tex"
+        entry.write_text("", encoding="utf-8")
+        os.utime(entry, ns=(i * 10**9, i * 10**9))
+    other = tmp_path / "fonttools_cache.sqlite3"
+    other.write_bytes(b"")
+
+    prune_catalog_cache(tmp_path, keep=2)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "catalog_3.tex",
+        "catalog_4.tex",
+        "fonttools_cache.sqlite3",
+    ]
@@ -0,0 +1,89 @@
+import io
+import random
+
+import pytest
+
+from fontshow.dump_fonts import (
+    best_unicode_cmap,
+    extract_unicode_coverage,
+    raw_cmap_codepoints,
+    unicode_codepoints,
+)
+
+
+def _build_font(cmap, symbol=False):
+    from fontTools.fontBuilder import FontBuilder
+    from fontTools.pens.ttGlyphPen import TTGlyphPen
+    from fontTools.ttLib import TTFont
+
+    names = sorted(set(cmap.values()) | {".notdef"}, key=lambda n: n != ".notdef")
+    fb = FontBuilder(1000, isTTF=True)
+    fb.setupGlyphOrder(names)
+    fb.setupCharacterMap(cmap)
+    if symbol:
+        # Keep a single Windows Symbol (3, 0) subtable, as in Wingdings
+        table = fb.font["cmap"]
+        table.tables = [
+            t for t in table.tables if (t.platformID, t.platEncID) == (3, 1)
+        ]
+        table.tables[0].platEncID = 0
+    glyph = TTGlyphPen(None).glyph()
+    fb.setupGlyf({name: glyph for name in names})
+    fb.setupHorizontalMetrics({name: (500, 0) for name in names})
+    fb.setupHorizontalHeader()
+    fb.setupNameTable({"familyName": "Test", "styleName": "Regular"})
+    fb.setupOS2()
+    fb.setupPost()
+    buf = io.BytesIO()
+    fb.save(buf)
+    buf.seek(0)
+    return lambda: TTFont(buf, lazy=True)
+
+
+@pytest.mark.parametrize("supplementary", [False, True])
+def test_unicode_codepoints_matches_best_cmap(supplementary):
+    pytest.importorskip("fontTools")
+    rng = random.Random(0)
+    glyphs = [".notdef"] + [f"g{i}" for i in range(40)]
+    codepoints = rng.sample(range(0x20, 0x600), 150)
+    if supplementary:
+        codepoints += rng.sample(range(0x1F300, 0x1F400), 30)
+    # Shuffled glyph ids force idRangeOffset segments in format 4
+    open_font = _build_font({cp: rng.choice(glyphs) for cp in codepoints})
+
+    expected = sorted(open_font().getBestCmap())
+    tt = open_font()
+
+    assert raw_cmap_codepoints(tt.reader["cmap"]) == expected
+    assert unicode_codepoints(tt) == expected
+    assert "cmap" not in tt.tables  # answered without decompiling
+
+
+def test_symbol_cmap_is_used_without_unicode_subtable():
+    pytest.importorskip("fontTools")
+    codepoints = [0xF020, 0xF041, 0xF042, 0xF0FF]
+    open_font = _build_font({cp: f"g{cp:X}" for cp in codepoints}, symbol=True)
+    tt = open_font()
+
+    assert raw_cmap_codepoints(tt.reader["cmap"]) == codepoints
+    assert unicode_codepoints(tt) == codepoints
+    assert sorted(best_unicode_cmap(open_font())) == codepoints
+    assert extract_unicode_coverage(open_font()) == {
+        "count": 4,
+        "min": 0xF020,
+        "max": 0xF0FF,
+    }
+
+
+def _cmap_table(platform_id, enc_id, subtable):
+    record = bytes([0, platform_id, 0, enc_id]) + (12).to_bytes(4, "big")
+    return b"\x00\x00\x00\x01" + record + subtable
+
+
+def test_raw_cmap_codepoints_defers_unsupported_subtables():
+    # Format 6 mapping U+0041..U+0042 to glyphs 1 and 2
+    format6 = bytes.fromhex("0006000e0000004100020001 0002".replace(" ", ""))
+
+    assert raw_cmap_codepoints(_cmap_table(3, 1, format6)) is None
+    assert raw_cmap_codepoints(_cmap_table(1, 0, format6)) == []
+    assert raw_cmap_codepoints(_cmap_table(3, 1, format6)[:-4]) is None
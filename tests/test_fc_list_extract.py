@@ -0,0 +1,91 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+from helpers import make_fc_query_output
+
+import fontshow.dump_fonts as dump_fonts
+from fontshow.dump_fonts import (
+    fc_list_extract,
+    fc_query_extract,
+    fc_query_extract_batch,
+)
+
+
+def _fc_list(*lines: str, returncode: int = 0):
+    return SimpleNamespace(
+        stdout="".join(f"{ln}\n" for ln in lines), returncode=returncode
+    )
+
+
+def test_fc_list_extract_matches_fc_query(monkeypatch):
+    monkeypatch.setattr(
+        "fontshow.dump_fonts.run_command",
+        lambda cmd: _fc_list(
+            '/fake/a.ttf\t0\ten|it\t"otlayout:latn otlayout:grek"\tFalse\tFalse\tTrue'
+        ),
+    )
+    batched = fc_list_extract()
+
+    monkeypatch.setattr(
+        "fontshow.dump_fonts.run_command",
+        lambda cmd: make_fc_query_output(
+            lang="en|it", scripts=["latn", "grek"], variable=True
+        ),
+    )
+    single = fc_query_extract(Path("/fake/a.ttf"))
+
+    assert batched == {Path("/fake/a.ttf").resolve(): single}
+
+
+def test_fc_list_extract_uses_lowest_face_index(monkeypatch):
+    monkeypatch.setattr(
+        "fontshow.dump_fonts.run_command",
+        lambda cmd: _fc_list(
+            "/fake/c.ttc\t1\tja\t\tFalse\tFalse\tFalse",
+            "/fake/c.ttc\t0\tzh-cn\t\tFalse\tFalse\tFalse",
+            "malformed line",
+        ),
+    )
+
+    result = fc_list_extract()
+
+    assert list(result) == [Path("/fake/c.ttc").resolve()]
+    assert result[Path("/fake/c.ttc").resolve()]["languages"] == ["zh-cn"]
+
+
+def test_fc_list_extract_failure(monkeypatch):
+    monkeypatch.setattr(
+        "fontshow.dump_fonts.run_command", lambda cmd: _fc_list(returncode=1)
+    )
+
+    assert fc_list_extract() is None
+
+
+def test_fc_query_extract_batch_matches_per_file(monkeypatch):
+    a, b, c = Path("/fake/a.ttf"), Path("/fake/b.ttc"), Path("/fake/c.ttf")
+    outputs = {
+        a: make_fc_query_output(lang="en", scripts=["latn"]).stdout,
+        b: make_fc_query_output(lang="ja", color=True).stdout,
+        c: "",
+    }
+
+    monkeypatch.setattr(
+        "fontshow.dump_fonts.run_command",
+        lambda cmd: SimpleNamespace(stdout=outputs[Path(cmd[-1])]),
+    )
+    single = {p: fc_query_extract(p) for p in outputs}
+
+    calls = []
+
+    def fake_run(cmd):
+        calls.append(cmd)
+        stdout = "".join(
+            f"file: {p}\n{outputs[Path(p)]}\n" for p in cmd[2:] if outputs[Path(p)]
+        )
+        return SimpleNamespace(stdout=stdout)
+
+    monkeypatch.setattr("fontshow.dump_fonts.run_command", fake_run)
+    monkeypatch.setattr(dump_fonts, "FC_QUERY_BATCH_SIZE", 2)
+
+    assert fc_query_extract_batch([a, b, c]) == single
+    assert [len(cmd) - 2 for cmd in calls] == [2, 1]
@@ -51,3 +51,38 @@ def test_fc_query_extract_empty_output(monkeypatch):
     assert result["decorative"] is False
     assert result["color"] is False
     assert result["variable"] is False
+
+
+def test_fc_query_extract_omits_charset_by_default(monkeypatch):
+    calls = []
+
+    def fake_run(cmd):
+        calls.append(cmd)
+        return make_fc_query_output(lang="en")
+
+    monkeypatch.setattr("fontshow.dump_fonts.run_command", fake_run)
+
+    result = fc_query_extract(Path("/fake/font.ttf"))
+
+    assert "%{charset}" not in " ".join(calls[0])
+    assert result["charset"] is None
+
+
+def test_fc_query_extract_include_charset(monkeypatch):
+    calls = []
+
+    def fake_run(cmd):
+        calls.append(cmd)
+        out = make_fc_query_output(lang="en")
+        out.stdout += "\ncharset: 0000-007F 0100-017F"
+        return out
+
+    monkeypatch.setattr("fontshow.dump_fonts.run_command", fake_run)
+
+    result = fc_query_extract(Path("/fake/font.ttf"), include_charset=True)
+
+    assert "%{charset}" in " ".join(calls[0])
+    assert result["charset"] == {
+        "source": "fontconfig",
+        "ranges": ["0000-007F", "0100-017F"],
+    }
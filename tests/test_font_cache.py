@@ -0,0 +1,90 @@
+import pytest
+
+from fontshow.dump_fonts import (
+    cache_get,
+    cache_put,
+    cache_put_many,
+    font_cache_key,
+    fonttools_extract_all,
+    fonttools_extract_cached,
+    read_font_header,
+    ttc_face_count,
+)
+
+
+def test_cache_roundtrip(tmp_path):
+    assert cache_get(tmp_path, "missing") is None
+
+    cache_put(tmp_path, "k", {"ok": True, "names": {"1": ["Test"]}})
+    cache_put(tmp_path, "k", {"ok": True, "names": {"1": ["Replaced"]}})
+
+    assert cache_get(tmp_path, "k") == {"ok": True, "names": {"1": ["Replaced"]}}
+
+
+def test_cache_put_many(tmp_path):
+    cache_put_many(tmp_path, [("a", {"ttc_index": 0}), ("b", {"ttc_index": 1})])
+    cache_put_many(tmp_path, [])
+
+    assert cache_get(tmp_path, "a") == {"ttc_index": 0}
+    assert cache_get(tmp_path, "b") == {"ttc_index": 1}
+
+
+def test_extract_reuses_cached_face(tmp_path):
+    pytest.importorskip("fontTools")
+    font = tmp_path / "fake.ttf"
+    font.write_bytes(b"\x00\x01\x00\x00not a real font")
+    cached = {"ok": True, "container": "TTF", "ttc_index": None, "marker": 1}
+    cache_put(tmp_path, font_cache_key(font), cached)
+
+    assert fonttools_extract_all(font, cache_dir=tmp_path) == [cached]
+
+    fresh = fonttools_extract_all(font, cache_dir=tmp_path, use_cache=False)
+    assert fresh[0]["ok"] is False
+    assert cache_get(tmp_path, font_cache_key(font)) == fresh[0]
+
+
+def test_memoized_faces_are_copies(tmp_path):
+    pytest.importorskip("fontTools")
+    font = tmp_path / "fake.ttf"
+    font.write_bytes(b"\x00\x01\x00\x00not a real font")
+    cache_put(tmp_path, font_cache_key(font), {"ok": True, "names": {"1": ["A"]}})
+
+    first = fonttools_extract_cached(font, cache_dir=tmp_path)
+    first[0]["names"]["1"].append("mutated")
+    second = fonttools_extract_cached(font, cache_dir=tmp_path)
+
+    assert second[0]["names"] == {"1": ["A"]}
+
+
+def test_ttc_face_count(tmp_path):
+    ttc = tmp_path / "c.ttc"
+    ttc.write_bytes(b"ttcf\x00\x01\x00\x00\x00\x00\x00\x03" + b"\x00" * 12)
+    ttf = tmp_path / "f.ttf"
+    ttf.write_bytes(b"\x00\x01\x00\x00" + b"\x00" * 20)
+
+    assert ttc_face_count(ttc) == 3
+    assert ttc_face_count(ttf) is None
+    assert ttc_face_count(tmp_path / "missing.ttc") is None
+
+
+def test_cached_ttc_faces_skip_opening(tmp_path, monkeypatch):
+    pytest.importorskip("fontTools")
+    ttc = tmp_path / "c.ttc"
+    ttc.write_bytes(b"ttcf\x00\x01\x00\x00\x00\x00\x00\x02")
+    for idx in range(2):
+        cache_put(tmp_path, font_cache_key(ttc, idx), {"ok": True})
+
+    def fail(*args, **kwargs):
+        raise AssertionError("collection opened on a warm cache")
+
+    monkeypatch.setattr("fontshow.dump_fonts.TTCollection", fail)
+    reads = []
+    monkeypatch.setattr(
+        "fontshow.dump_fonts.read_font_header",
+        lambda path, size=12: reads.append(path) or read_font_header(path, size),
+    )
+
+    faces = fonttools_extract_all(ttc, cache_dir=tmp_path)
+    assert reads == [ttc]
+    assert [f["ttc_index"] for f in faces] == [0, 1]
+    assert all(f["ttc_count"] == 2 for f in faces)
@@ -0,0 +1,124 @@
+import contextlib
+from pathlib import Path
+from types import SimpleNamespace
+
+from fontshow.dump_fonts import (
+    get_installed_font_files_linux,
+    get_installed_font_files_windows,
+    get_registered_font_files_windows,
+    identical_file_map,
+    iter_in_discovery_order,
+)
+
+
+def test_linux_discovery_dedups_faces_and_drops_stale(tmp_path, monkeypatch):
+    font = tmp_path / "a.ttc"
+    font.write_bytes(b"ttcf")
+    stale = tmp_path / "gone.ttf"
+    monkeypatch.setattr(
+        "fontshow.dump_fonts.run_command",
+        lambda cmd: SimpleNamespace(
+            returncode=0, stdout=f"{font}\n{font}\n{stale}\n\n"
+        ),
+    )
+
+    assert get_installed_font_files_linux() == [font.resolve()]
+
+
+def test_windows_discovery_scans_recursively(tmp_path, monkeypatch):
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "A.TTF").write_bytes(b"")
+    (tmp_path / "sub" / "b.woff2").write_bytes(b"")
+    (tmp_path / "readme.txt").write_bytes(b"")
+    monkeypatch.setattr(
+        "fontshow.dump_fonts._windows_font_dirs", lambda: [tmp_path, tmp_path]
+    )
+
+    assert get_installed_font_files_windows() == sorted(
+        [tmp_path / "A.TTF", tmp_path / "sub" / "b.woff2"]
+    )
+
+
+class _FakeWinreg:
+    HKEY_LOCAL_MACHINE = "HKLM"
+    HKEY_CURRENT_USER = "HKCU"
+
+    def __init__(self, keys):
+        self.keys = keys
+
+    @contextlib.contextmanager
+    def OpenKey(self, hive, path):
+        if hive not in self.keys:
+            raise FileNotFoundError(path)
+        yield self.keys[hive]
+
+    def QueryInfoKey(self, key):
+        return (0, len(key), 0)
+
+    def EnumValue(self, key, index):
+        return (f"Font {index}", key[index], 1)
+
+
+def test_windows_discovery_reads_registry(tmp_path, monkeypatch):
+    fonts = tmp_path / "Fonts"
+    fonts.mkdir()
+    (fonts / "arial.ttf").write_bytes(b"")
+    (fonts / "modern.fon").write_bytes(b"")
+    user = tmp_path / "user.otf"
+    user.write_bytes(b"")
+    monkeypatch.setenv("WINDIR", str(tmp_path))
+    monkeypatch.setattr(
+        "fontshow.dump_fonts.winreg",
+        _FakeWinreg(
+            {
+                "HKLM": ["arial.ttf", "ARIAL.TTF", "modern.fon", "removed.ttf"],
+                "HKCU": [str(user)],
+            }
+        ),
+    )
+
+    assert get_installed_font_files_windows() == sorted([fonts / "arial.ttf", user])
+
+
+def test_windows_registry_unavailable(monkeypatch):
+    monkeypatch.setattr("fontshow.dump_fonts.winreg", _FakeWinreg({}))
+    assert get_registered_font_files_windows() is None
+
+    monkeypatch.setattr("fontshow.dump_fonts.winreg", None)
+    assert get_registered_font_files_windows() is None
+
+
+def test_identical_file_map_groups_copies(tmp_path):
+    a, b, c, d = (tmp_path / n for n in ("a.ttf", "b.ttf", "c.ttf", "d.ttf"))
+    a.write_bytes(b"font-one")
+    b.write_bytes(b"font-two")  # same size, different content
+    c.write_bytes(b"font-one")
+    d.write_bytes(b"other")
+    missing = tmp_path / "missing.ttf"
+
+    assert identical_file_map([a, b, c, d, missing]) == {
+        a: a,
+        b: b,
+        c: a,
+        d: d,
+        missing: missing,
+    }
+
+
+def test_results_are_reordered_lazily():
+    a, b, c, d = (Path(n) for n in ("a.ttf", "b.ttf", "c.ttf", "d.ttf"))
+    canonical = {a: a, b: b, c: a, d: d}
+    schedule = [b, a, d]
+    consumed = []
+
+    def extracted():
+        for p in schedule:
+            consumed.append(p)
+            yield p.stem.upper()
+
+    results = iter_in_discovery_order([a, b, c, d], canonical, schedule, extracted())
+
+    assert next(results) == "A"
+    assert consumed == [b, a]
+    assert list(results) == ["B", "A", "D"]
+    assert consumed == schedule
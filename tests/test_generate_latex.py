@@ -0,0 +1,32 @@
+import io
+
+from fontshow.create_catalog import generate_latex
+
+
+def _font(i: int) -> dict:
+    return {
+        "identity": {"family": f"Family & Co {i:03d}"},
+        "classification": {"is_emoji": i % 7 == 0, "is_decorative": i % 11 == 0},
+        "inference": {
+            "scripts": ["latn", "arab", "hebr"][: i % 4],
+            "languages": ["en", "ar", "he", "it"][i % 4 :][:1],
+        },
+    }
+
+
+def test_generate_latex_family_ids_are_unique():
+    fonts = [_font(i) for i in range(250)]
+
+    latex = generate_latex(fonts)
+
+    # Family ids are per-family counters, so each one is unique
+    assert latex.count("Family=FS00000001,") == 1
+    assert "Family=FS00000250," in latex
+
+
+def test_generate_latex_streams_to_output():
+    fonts = [_font(i) for i in range(10)]
+    out = io.StringIO()
+
+    assert generate_latex(fonts, out) is None
+    assert out.getvalue() == generate_latex(fonts)
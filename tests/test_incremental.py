@@ -0,0 +1,89 @@
+import json
+import os
+
+from fontshow.dump_fonts import (
+    build_manifest,
+    inventory_is_up_to_date,
+    load_reusable_descriptors,
+    manifest_path_for,
+    stat_font_files,
+)
+
+OPTIONS = {"format": "json", "include_fc_charset": False}
+
+
+def _write_previous_run(tmp_path, font_files):
+    output = tmp_path / "inv.json"
+    fonts = [{"identity": {"file": str(p), "ttc_index": None}} for p in font_files]
+    output.write_text(json.dumps({"metadata": {}, "fonts": fonts}))
+    manifest = build_manifest(font_files, stat_font_files(font_files), OPTIONS)
+    manifest_path_for(output).write_text(json.dumps(manifest))
+    return output
+
+
+def test_unchanged_files_are_reused(tmp_path):
+    a, b = tmp_path / "a.ttf", tmp_path / "b.ttf"
+    a.write_bytes(b"a")
+    b.write_bytes(b"b")
+    output = _write_previous_run(tmp_path, [a, b])
+
+    st = b.stat()
+    os.utime(b, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    previous = load_reusable_descriptors(output, stat_font_files([a, b]), OPTIONS)
+
+    assert list(previous) == [str(a)]
+    assert previous[str(a)] == [{"identity": {"file": str(a), "ttc_index": None}}]
+
+
+def test_nothing_is_reused_when_options_change(tmp_path):
+    a = tmp_path / "a.ttf"
+    a.write_bytes(b"a")
+    output = _write_previous_run(tmp_path, [a])
+
+    other = dict(OPTIONS, include_fc_charset=True)
+    assert load_reusable_descriptors(output, stat_font_files([a]), other) == {}
+
+
+def test_reuse_survives_output_only_option_changes(tmp_path):
+    a = tmp_path / "a.ttf"
+    a.write_bytes(b"a")
+    output = _write_previous_run(tmp_path, [a])
+
+    other = dict(OPTIONS, format="ndjson", compact=True)
+    previous = load_reusable_descriptors(output, stat_font_files([a]), other)
+    assert list(previous) == [str(a)]
+
+
+def test_nothing_is_reused_without_manifest(tmp_path):
+    a = tmp_path / "a.ttf"
+    a.write_bytes(b"a")
+    output = _write_previous_run(tmp_path, [a])
+    manifest_path_for(output).unlink()
+
+    assert load_reusable_descriptors(output, stat_font_files([a]), OPTIONS) == {}
+
+
+def test_up_to_date_only_on_exact_match(tmp_path):
+    a, b = tmp_path / "a.ttf", tmp_path / "b.ttf"
+    a.write_bytes(b"a")
+    b.write_bytes(b"b")
+    output = _write_previous_run(tmp_path, [a, b])
+
+    assert inventory_is_up_to_date(output, [a, b], stat_font_files([a, b]), OPTIONS)
+    other = dict(OPTIONS, format="ndjson")
+    assert not inventory_is_up_to_date(output, [a, b], stat_font_files([a, b]), other)
+
+
+def test_not_up_to_date_when_file_set_changes(tmp_path):
+    a, b, c = tmp_path / "a.ttf", tmp_path / "b.ttf", tmp_path / "c.ttf"
+    for p in (a, b, c):
+        p.write_bytes(p.name.encode())
+    output = _write_previous_run(tmp_path, [a, b])
+
+    # Deleted font
+    assert not inventory_is_up_to_date(output, [a], stat_font_files([a]), OPTIONS)
+
+    # New font carrying an old timestamp
+    os.utime(c, ns=(0, 0))
+    files = [a, b, c]
+    assert not inventory_is_up_to_date(output, files, stat_font_files(files), OPTIONS)
@@ -1,4 +1,4 @@
-from fontshow.parse_font_inventory import infer_scripts
+from fontshow.parse_font_inventory import infer_coverage, infer_languages, infer_scripts
 
 
 def test_infer_scripts_latn_from_unicode_blocks():
@@ -65,3 +65,20 @@ def test_infer_scripts_cyrillic():
 
     scripts = infer_scripts(coverage)
     assert scripts == ["cyrl"]
+
+
+def test_infer_coverage_matches_infer_scripts_and_languages():
+    coverages = [
+        {"unicode_blocks": {"Cyrillic": 150, "Latin Extended-A": 3}},
+        {"unicode_blocks": {"Latin Extended-A": 3, "Cyrillic": 150}},
+        {"unicode": {"max": 0x05D0}},
+        {},
+    ]
+
+    for coverage in coverages:
+        for level in ("conservative", "medium", "aggressive"):
+            scripts = infer_scripts(coverage, level)
+            assert infer_coverage(coverage, level) == (
+                tuple(scripts),
+                tuple(infer_languages(scripts)),
+            )
@@ -0,0 +1,32 @@
+from types import SimpleNamespace
+
+from fontshow.dump_fonts import _best_name, extract_name_table
+
+
+class _Record:
+    def __init__(self, name_id, value):
+        self.nameID = name_id
+        self.value = value
+
+    def toUnicode(self):
+        if self.value is None:
+            raise AssertionError("unused name record decoded")
+        return self.value
+
+
+def test_extract_name_table_decodes_only_descriptor_ids():
+    records = [
+        _Record(1, "Family"),
+        _Record(256, None),
+        _Record(1, " "),
+        _Record(1, "Family"),
+        _Record(4, "Family Bold"),
+        _Record(5, None),
+    ]
+    tt = {"name": SimpleNamespace(names=records)}
+
+    names = extract_name_table(tt)
+
+    assert names == {"1": ["Family", " "], "4": ["Family Bold"]}
+    assert _best_name(names, 1) == "Family"
+    assert extract_name_table(tt, frozenset({1})) == {"1": ["Family", " "]}
@@ -0,0 +1,60 @@
+import gzip
+import io
+from pathlib import Path
+
+import pytest
+
+from fontshow.dump_fonts import dump_json, open_output, write_inventory_json
+
+
+def test_open_output_writes_atomically(tmp_path):
+    out = tmp_path / "inv.json"
+    out.write_bytes(b"old")
+
+    with pytest.raises(RuntimeError):
+        with open_output(out) as f:
+            f.write(b"partial")
+            raise RuntimeError("interrupted")
+
+    assert out.read_bytes() == b"old"
+    assert list(tmp_path.iterdir()) == [out]
+
+    with open_output(out) as f:
+        f.write(b"new")
+    assert out.read_bytes() == b"new"
+
+
+def test_open_output_gzip_is_reproducible(tmp_path):
+    first, second = tmp_path / "a.json.gz", tmp_path / "b.json.gz"
+    for path in (first, second):
+        with open_output(path, compress=True) as f:
+            f.write(b'{"fonts": []}')
+
+    assert gzip.decompress(first.read_bytes()) == b'{"fonts": []}'
+    assert first.read_bytes() == second.read_bytes()
+
+
+def test_open_output_dash_writes_to_stdout(tmp_path, monkeypatch, capsysbinary):
+    monkeypatch.chdir(tmp_path)
+
+    with open_output(Path("-")) as f:
+        f.write(b'{"metadata": {}}\n')
+
+    assert capsysbinary.readouterr().out == b'{"metadata": {}}\n'
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize("indent", [True, False])
+@pytest.mark.parametrize("count", [0, 1, 3])
+def test_write_inventory_json_matches_dump_json(indent, count):
+    metadata = {"schema_version": "1.0", "environment": {"os": "linux"}, "e": {}}
+    fonts = [
+        {"identity": {"file": f"/f/{i}.ttf"}, "names": {"1": ["Ä\nB"]}, "x": []}
+        for i in range(count)
+    ]
+    buf = io.BytesIO()
+
+    write_inventory_json(buf, metadata, iter(fonts), indent=indent)
+
+    expected = dump_json({"metadata": metadata, "fonts": fonts}, indent=indent)
+    assert buf.getvalue() == expected
@@ -0,0 +1,40 @@
+from fontshow.create_catalog import select_catalog_fonts
+
+
+def _font(family: str, ttc_index: int | None = None) -> dict:
+    return {"identity": {"family": family, "ttc_index": ttc_index}}
+
+
+def _families(fonts: list[dict]) -> list[str]:
+    return [f["identity"]["family"] for f in fonts]
+
+
+def test_select_catalog_fonts_dedup_and_sort():
+    fonts = [_font("Beta"), _font("Alpha", 0), _font("Alpha", 1), _font("Gamma")]
+
+    selected = select_catalog_fonts(fonts, set())
+
+    assert _families(selected) == ["Alpha", "Beta", "Gamma"]
+    # First occurrence of each family is kept
+    assert selected[0]["identity"]["ttc_index"] == 0
+
+
+def test_select_catalog_fonts_test_filter_is_case_insensitive():
+    fonts = [_font("Noto Sans"), _font("DejaVu Serif"), _font("NOTO Serif")]
+
+    selected = select_catalog_fonts(fonts, {"noto"})
+
+    assert _families(selected) == ["NOTO Serif", "Noto Sans"]
+
+
+def test_select_catalog_fonts_number_limits():
+    fonts = [_font(name) for name in ["D", "C", "B", "A"]]
+
+    assert _families(select_catalog_fonts(fonts, set(), 2)) == ["C", "D"]
+    assert _families(select_catalog_fonts(fonts, set(), -2)) == ["A", "B"]
+
+
+def test_select_catalog_fonts_accepts_iterators_and_legacy_names():
+    selected = select_catalog_fonts(iter(["Zeta", "Eta"]), set())
+
+    assert _families(selected) == ["Eta", "Zeta"]
@@ -0,0 +1,70 @@
+import pytest
+
+import fontshow.dump_fonts as dump_fonts
+from fontshow.dump_fonts import _fonttools_extract_from_tt, table_tags
+
+
+def _build_ttc(path):
+    from fontTools.fontBuilder import FontBuilder
+    from fontTools.pens.ttGlyphPen import TTGlyphPen
+    from fontTools.ttLib import TTCollection
+
+    fonts = []
+    for family in ("Alpha", "Beta"):
+        fb = FontBuilder(1000, isTTF=True)
+        fb.setupGlyphOrder([".notdef", "A"])
+        fb.setupCharacterMap({0x41: "A", 0x4E00: "A"})
+        glyph = TTGlyphPen(None).glyph()
+        fb.setupGlyf({".notdef": glyph, "A": glyph})
+        fb.setupHorizontalMetrics({".notdef": (500, 0), "A": (500, 0)})
+        fb.setupHorizontalHeader()
+        fb.setupNameTable({"familyName": family, "styleName": "Regular"})
+        fb.setupOS2()
+        fb.setupPost()
+        fonts.append(fb.font)
+    col = TTCollection()
+    col.fonts = fonts
+    col.save(path)
+
+
+def test_faces_sharing_cmap_compute_coverage_once(tmp_path, monkeypatch):
+    pytest.importorskip("fontTools")
+    from fontTools.ttLib import TTCollection
+
+    ttc = tmp_path / "shared.ttc"
+    _build_ttc(ttc)
+
+    def extract(shared):
+        col = TTCollection(ttc, lazy=True, shareTables=True)
+        return [
+            _fonttools_extract_from_tt(
+                path=ttc, container="TTC", tt=tt, ttc_index=idx, shared=shared
+            )
+            for idx, tt in enumerate(col.fonts)
+        ]
+
+    expected = extract(None)
+
+    calls = []
+    unicode_codepoints = dump_fonts.unicode_codepoints
+    monkeypatch.setattr(
+        dump_fonts,
+        "unicode_codepoints",
+        lambda tt: calls.append(tt) or unicode_codepoints(tt),
+    )
+
+    assert extract({}) == expected
+    assert len(calls) == 1
+    assert [face["names"]["1"] for face in expected] == [["Alpha"], ["Beta"]]
+
+
+def test_table_tags_matches_ttfont_keys(tmp_path):
+    pytest.importorskip("fontTools")
+    from fontTools.ttLib import TTCollection
+
+    ttc = tmp_path / "shared.ttc"
+    _build_ttc(ttc)
+
+    for tt in TTCollection(ttc, lazy=True).fonts:
+        tt["name"]  # one decompiled table, the others still lazy
+        assert table_tags(tt) == sorted(tt.keys())
@@ -0,0 +1,34 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from fontshow.parse_font_inventory import write_inventory
+
+
+def test_write_inventory_replaces_file(tmp_path):
+    out = tmp_path / "inv.json"
+    out.write_text("old", encoding="utf-8")
+
+    write_inventory(out, {"fonts": []})
+
+    assert json.loads(out.read_text(encoding="utf-8")) == {"fonts": []}
+    assert list(tmp_path.iterdir()) == [out]
+
+
+def test_write_inventory_failure_leaves_no_temp_file(tmp_path, monkeypatch):
+    out = tmp_path / "inv.json"
+    out.write_text("old", encoding="utf-8")
+    write_bytes = Path.write_bytes
+
+    def disk_full(self, data):
+        write_bytes(self, data[:3])
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(Path, "write_bytes", disk_full)
+
+    with pytest.raises(OSError):
+        write_inventory(out, {"fonts": []})
+
+    assert out.read_text(encoding="utf-8") == "old"
+    assert list(tmp_path.iterdir()) == [out]